@@ -8,12 +8,18 @@ It provides a clean, automated workflow with robust error handling.
 
 import sys
 import os
+import math
+import time
 from pathlib import Path
 from typing import Optional, Callable
 import traceback
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
 
-import task1_monte_carlo as mc
-import task2_sensitivity_analysis as sa
+try:
+    import readline  # Line editing and tab completion (absent on some platforms)
+except ImportError:
+    readline = None
 
 # Color codes for terminal output (works on most terminals)
 class Colors:
@@ -28,6 +34,13 @@ class Colors:
     UNDERLINE = '\033[4m'
     INFO = '\033[10m'
 
+# Columns needed to list and select blocks (the calculation loads its own)
+SHEET_COLUMNS = ('Sheet',)
+
+# Escape codes used inside per-block loops, bound once at module level
+_BOLD, _ENDC = Colors.BOLD, Colors.ENDC
+_GREEN, _CYAN, _BLUE = Colors.GREEN, Colors.CYAN, Colors.BLUE
+
 def print_header(text: str):
     """Print formatted header."""
     print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*70}")
@@ -91,19 +104,19 @@ def check_environment() -> bool:
     all_ok = True
     
     # Check Python version
-    if sys.version_info < (3, 7):
-        print_error(f"Python 3.7+ required, found {sys.version}")
+    if sys.version_info < (3, 8):
+        print_error(f"Python 3.8+ required, found {sys.version}")
         all_ok = False
     else:
         print_success(f"Python version: {sys.version_info.major}.{sys.version_info.minor}")
     
-    # Check for required modules
+    # Check for required modules (located, not imported: the task modules
+    # import them when they actually run)
     required_modules = ['numpy', 'pandas', 'matplotlib', 'math', 'openpyxl']
     for module in required_modules:
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             print_success(f"Module '{module}' found")
-        except ImportError:
+        else:
             print_error(f"Module '{module}' not found")
             all_ok = False
     
@@ -156,6 +169,45 @@ def get_excel_file() -> Optional[Path]:
         print_success(f"Excel file validated: {path}")
         return path
 
+def _set_block_completer(blocks):
+    """
+    Install tab completion of block names on input().
+    
+    Args:
+        blocks: Block names offered as completions
+    
+    Returns:
+        (completer, delimiters) previously installed, for _restore_completer,
+        or None if readline is unavailable
+    """
+    if readline is None:
+        return None
+    
+    previous = (readline.get_completer(), readline.get_completer_delims())
+    matches = []
+    
+    def complete(text, state):
+        if state == 0:
+            matches[:] = [b for b in blocks if b.startswith(text)]
+        return matches[state] if state < len(matches) else None
+    
+    readline.set_completer(complete)
+    # Block names contain '/' and spaces: complete on the whole line
+    readline.set_completer_delims('')
+    if 'libedit' in (readline.__doc__ or ''):
+        readline.parse_and_bind('bind ^I rl_complete')
+    else:
+        readline.parse_and_bind('tab: complete')
+    return previous
+
+def _restore_completer(previous):
+    """Reinstall the completer saved by _set_block_completer."""
+    if previous is None:
+        return
+    completer, delims = previous
+    readline.set_completer(completer)
+    readline.set_completer_delims(delims)
+
 def get_sheet_name(excel_file: Path) -> Optional[str]:
     """
     Get block name from user with hierarchical preview.
@@ -170,120 +222,135 @@ def get_sheet_name(excel_file: Path) -> Optional[str]:
         Block name (Sheet column value) if valid, None otherwise
     """
     try:
+        import numpy as np
         import pandas as pd
+        import reliability_math as rm
         
         print_info("Loading Excel file to list available blocks...")
         
-        # Read the Excel file - assuming first sheet or 'Board3'
-        try:
-            df = pd.read_excel(excel_file, sheet_name='Board3')
-        except:
-            df = pd.read_excel(excel_file, sheet_name=0)
+        # Read the Excel file - 'Board3' if present, otherwise the first sheet
+        df = rm.load_components(excel_file, columns=SHEET_COLUMNS)
         
         if 'Sheet' not in df.columns:
             print_error("Excel file must have a 'Sheet' column containing block names")
             return None
         
+        # Component count per block, computed once and looked up below
+        counts = df['Sheet'].value_counts()
+        
         # Get unique blocks and sort them
         blocks = sorted(df['Sheet'].unique())
+        block_array = np.asarray(blocks, dtype=str)  # for substring searches
         
-        # Organize blocks hierarchically for display
-        print(f"\n{Colors.BOLD}Available blocks (hierarchical structure):{Colors.ENDC}")
-        print(f"{Colors.CYAN}{'='*70}{Colors.ENDC}")
+        # Organize blocks hierarchically for display. The listing is
+        # collected in a buffer and written in one go.
+        out = [
+            f"\n{Colors.BOLD}Available blocks (hierarchical structure):{Colors.ENDC}\n",
+            f"{Colors.CYAN}{'='*70}{Colors.ENDC}\n",
+        ]
         
-        # Group by top-level hierarchy
-        hierarchy = {}
-        for block in blocks:
-            parts = [p for p in block.split('/') if p]
-            if len(parts) >= 2:
-                top_level = '/' + parts[0] + '/' + parts[1] + '/'
-                if top_level not in hierarchy:
-                    hierarchy[top_level] = []
-                hierarchy[top_level].append(block)
+        # Group by top-level hierarchy: split every path in one pass and
+        # key each block on its first two levels ('/Project/Subsystem/')
+        names = pd.Series(blocks, dtype=object)
+        parts = names.str.strip('/').str.split('/', expand=True)
+        if parts.shape[1] >= 2:
+            top = '/' + parts[0] + '/' + parts[1] + '/'
+        else:
+            top = pd.Series(None, index=names.index, dtype=object)
+        hierarchy_df = pd.DataFrame({
+            'block': names,
+            'top': top,
+            'depth': names.str.count('/'),
+        }).dropna(subset=['top'])
         
         # Display organized by top-level
         block_list = []
         idx = 1
         
-        for top_level in sorted(hierarchy.keys()):
+        # Blocks are sorted and each key is a prefix of its blocks, so keys
+        # first appear in sorted order as well: no need to sort them again
+        for top_level, group in hierarchy_df.groupby('top', sort=False):
             # Count total components in this top-level
-            top_blocks = hierarchy[top_level]
-            total_comps = sum(len(df[df['Sheet'] == b]) for b in top_blocks)
+            top_blocks = group['block'].tolist()
+            total_comps = int(counts.loc[top_blocks].sum())
+            top_level_depth = top_level.count('/')
             
-            print(f"\n{Colors.BOLD}{top_level}{Colors.ENDC} ({total_comps} total components)")
+            out.append(f"\n{_BOLD}{top_level}{_ENDC} ({total_comps} total components)\n")
             
-            for block in sorted(top_blocks):
-                comp_count = len(df[df['Sheet'] == block])
+            for block, block_depth in zip(top_blocks, group['depth'].tolist()):
+                comp_count = int(counts.get(block, 0))
                 
                 # Calculate indentation based on depth
-                depth = block.count('/') - top_level.count('/')
+                depth = block_depth - top_level_depth
                 indent = "  " + "  " * depth
                 
                 # Different color for different depths
-                if depth == 0:
-                    color = Colors.GREEN
-                elif depth == 1:
-                    color = Colors.CYAN
-                else:
-                    color = Colors.BLUE
+                color = _GREEN if depth == 0 else _CYAN if depth == 1 else _BLUE
                 
-                print(f"{color}{idx:3d}. {indent}{block:<50} ({comp_count:3d} components){Colors.ENDC}")
+                out.append(f"{color}{idx:3d}. {indent}{block:<50} ({comp_count:3d} components){_ENDC}\n")
                 block_list.append(block)
                 idx += 1
         
-        print(f"\n{Colors.CYAN}{'='*70}{Colors.ENDC}")
+        out.append(f"\n{Colors.CYAN}{'='*70}{Colors.ENDC}\n")
+        sys.stdout.write(''.join(out))
+        sys.stdout.flush()
         print_info(f"\nTotal: {len(block_list)} blocks with {len(df)} components")
         print_info("\nEnter block number or exact block name:")
         print(f"{Colors.YELLOW}Tip: Start with a top-level block and use sub-block processing!{Colors.ENDC}")
         
-        while True:
-            choice = input(f"\n{Colors.BOLD}Block: {Colors.ENDC}").strip()
-            
-            if not choice:
-                print_warning("No block selected.")
-                return None
-            
-            # Check if user entered a number
-            if choice.isdigit():
-                idx = int(choice) - 1
-                if 0 <= idx < len(block_list):
-                    block_name = block_list[idx]
-                    comp_count = len(df[df['Sheet'] == block_name])
-                    print_success(f"Selected: {block_name} ({comp_count} components)")
-                    return block_name
-                else:
-                    print_error(f"Invalid number. Please choose 1-{len(block_list)}")
+        # Tab-complete block names at the prompt
+        previous_completer = _set_block_completer(blocks)
+        try:
+            while True:
+                choice = input(f"\n{Colors.BOLD}Block: {Colors.ENDC}").strip()
+                
+                if not choice:
+                    print_warning("No block selected.")
+                    return None
+                
+                # Check if user entered a number
+                if choice.isdigit():
+                    idx = int(choice) - 1
+                    if 0 <= idx < len(block_list):
+                        block_name = block_list[idx]
+                        comp_count = int(counts.get(block_name, 0))
+                        print_success(f"Selected: {block_name} ({comp_count} components)")
+                        return block_name
+                    else:
+                        print_error(f"Invalid number. Please choose 1-{len(block_list)}")
+                        continue
+                
+                # Check if user entered an exact name
+                if choice in blocks:
+                    comp_count = int(counts.get(choice, 0))
+                    print_success(f"Selected: {choice} ({comp_count} components)")
+                    return choice
+                
+                # Check for partial match (helpful for long paths)
+                matches = [blocks[i] for i in np.flatnonzero(np.char.find(block_array, choice) >= 0)]
+                if len(matches) == 1:
+                    comp_count = int(counts.get(matches[0], 0))
+                    print_info(f"Found match: {matches[0]}")
+                    confirm = input(f"{Colors.YELLOW}Use this block? (y/n): {Colors.ENDC}").lower()
+                    if confirm == 'y':
+                        print_success(f"Selected: {matches[0]} ({comp_count} components)")
+                        return matches[0]
+                elif len(matches) > 1:
+                    print_warning(f"Multiple matches found for '{choice}':")
+                    for i, match in enumerate(matches[:5], 1):
+                        comp_count = int(counts.get(match, 0))
+                        print(f"  {i}. {match} ({comp_count} components)")
+                    if len(matches) > 5:
+                        print(f"  ... and {len(matches) - 5} more")
+                    print_info("Please be more specific or use the block number.")
                     continue
-            
-            # Check if user entered an exact name
-            if choice in blocks:
-                comp_count = len(df[df['Sheet'] == choice])
-                print_success(f"Selected: {choice} ({comp_count} components)")
-                return choice
-            
-            # Check for partial match (helpful for long paths)
-            matches = [b for b in blocks if choice in b]
-            if len(matches) == 1:
-                comp_count = len(df[df['Sheet'] == matches[0]])
-                print_info(f"Found match: {matches[0]}")
-                confirm = input(f"{Colors.YELLOW}Use this block? (y/n): {Colors.ENDC}").lower()
-                if confirm == 'y':
-                    print_success(f"Selected: {matches[0]} ({comp_count} components)")
-                    return matches[0]
-            elif len(matches) > 1:
-                print_warning(f"Multiple matches found for '{choice}':")
-                for i, match in enumerate(matches[:5], 1):
-                    comp_count = len(df[df['Sheet'] == match])
-                    print(f"  {i}. {match} ({comp_count} components)")
-                if len(matches) > 5:
-                    print(f"  ... and {len(matches) - 5} more")
-                print_info("Please be more specific or use the block number.")
-                continue
-            
-            print_error(f"Block '{choice}' not found in Excel file.")
-            retry = input(f"{Colors.YELLOW}Try again? (y/n): {Colors.ENDC}").lower()
-            if retry != 'y':
-                return None
+                
+                print_error(f"Block '{choice}' not found in Excel file.")
+                retry = input(f"{Colors.YELLOW}Try again? (y/n): {Colors.ENDC}").lower()
+                if retry != 'y':
+                    return None
+        finally:
+            _restore_completer(previous_completer)
     
     except Exception as e:
         print_error(f"Error reading Excel file: {e}")
@@ -374,6 +441,47 @@ Your Excel file should have these key columns:
     
     input(f"\n{Colors.BOLD}Press Enter to continue...{Colors.ENDC}")
 
+# Sub-block runs covering at least this many components are spread over
+# worker processes; below it, starting the pool costs more than it saves
+PARALLEL_MIN_COMPONENTS = 5000
+
+# Minimum time between two redraws of the progress line (seconds)
+PROGRESS_INTERVAL = 0.1
+
+def _block_summary(block_df, sheet: str) -> dict:
+    """
+    Compute the reliability summary row of one block.
+    
+    Defined at module level so it can run in a worker process.
+    
+    Args:
+        block_df: Component rows of the block
+        sheet: Block name (Sheet column value)
+    
+    Returns:
+        Dictionary with Block, Lambda, Reliability and Components entries
+    """
+    import reliability_math as rm
+    
+    n_components, lam, R = rm.calculate_block_reliability(
+        None, sheet,
+        ni=rm.NI, dt=rm.DT, t_mission=rm.T_MISSION,
+        pi_i=rm.PI_I, leos=rm.LEOS,
+        verbose=False,  # Disable verbose to avoid cluttering output
+        return_df=False,  # Only the totals are shown
+        block_df=block_df
+    )
+    return _summary_row(sheet, n_components, lam, R)
+
+def _summary_row(sheet: str, n_components: int, lam: float, R: float) -> dict:
+    """Summary table row of one block"""
+    return {
+        'Block': sheet,
+        'Lambda': lam,
+        'Reliability': R,
+        'Components': n_components
+    }
+
 def run_block_reliability():
     """Execute deterministic block reliability calculation."""
     print_header("BLOCK RELIABILITY CALCULATION")
@@ -404,22 +512,25 @@ def run_block_reliability():
     print_info("Starting reliability calculation...")
     
     def execute():
-        import pandas as pd
+        import numpy as np
         import reliability_math as rm
         
         # Load Excel file
         print_info(f"Loading data from {excel_file}...")
-        df = pd.read_excel(excel_file)
+        df = rm.load_components(excel_file, columns=SHEET_COLUMNS)
         
         if 'Sheet' not in df.columns:
             raise ValueError("Excel file must have a 'Sheet' column")
         
+        # Per-block frames, grouped once per file version and reused
+        sheet_frames = rm.load_block_frames(excel_file)
+        
         # Get all matching sheets
         if process_subblocks:
             # Find all sheets that start with the selected sheet name
-            all_sheets = df['Sheet'].unique()
-            matching_sheets = [s for s in all_sheets if s.startswith(sheet_name)]
-            matching_sheets.sort()
+            # (block names are the sorted categories of the Sheet column)
+            all_sheets = np.asarray(df['Sheet'].cat.categories, dtype=str)
+            matching_sheets = all_sheets[np.char.startswith(all_sheets, sheet_name)].tolist()
             
             if not matching_sheets:
                 print_warning(f"No sheets found starting with '{sheet_name}'")
@@ -433,23 +544,36 @@ def run_block_reliability():
             
             # Calculate reliability for each block
             print(f"\n{Colors.CYAN}Processing {len(matching_sheets)} blocks...{Colors.ENDC}")
+            # Workers only receive the rows of their own block
+            block_frames = [sheet_frames[sheet] for sheet in matching_sheets]
+            n_components = sum(len(frame) for frame in block_frames)
+            
+            executor = None
+            if len(block_frames) > 1 and n_components >= PARALLEL_MIN_COMPONENTS:
+                executor = ProcessPoolExecutor()
+                summaries = executor.map(_block_summary, block_frames, matching_sheets)
+            else:
+                # Block totals are memoized per file version, so reruns are free
+                summaries = (_summary_row(sheet, *rm.block_totals(excel_file, sheet))
+                             for sheet in matching_sheets)
+            
             results = []
-            for i, sheet in enumerate(matching_sheets, 1):
-                # Progress indicator
-                print(f"  [{i}/{len(matching_sheets)}] {sheet}...", end='\r')
-                
-                comp_df, lam, R = rm.calculate_block_reliability(
-                    df, sheet, 
-                    ni=rm.NI, dt=rm.DT, t_mission=rm.T_MISSION,
-                    pi_i=rm.PI_I, leos=rm.LEOS, 
-                    verbose=False  # Disable verbose to avoid cluttering output
-                )
-                results.append({
-                    'Block': sheet,
-                    'Lambda': lam,
-                    'Reliability': R,
-                    'Components': len(comp_df)
-                })
+            show_progress = sys.stdout.isatty()
+            last_update = 0.0
+            try:
+                for i, sheet in enumerate(matching_sheets, 1):
+                    # Progress indicator, redrawn at most every PROGRESS_INTERVAL
+                    # seconds (and never when output is redirected)
+                    now = time.monotonic()
+                    if show_progress and (now - last_update >= PROGRESS_INTERVAL
+                                          or i == len(matching_sheets)):
+                        sys.stdout.write(f"  [{i}/{len(matching_sheets)}] {sheet}...\r")
+                        sys.stdout.flush()
+                        last_update = now
+                    results.append(next(summaries))
+            finally:
+                if executor is not None:
+                    executor.shutdown()
             
             # Clear progress line
             print(f"  {Colors.GREEN}✓ All blocks processed{Colors.ENDC}" + " " * 50)
@@ -477,9 +601,11 @@ def run_block_reliability():
                 print(f"{r['Block']:<55} {r['Components']:>6} {r['Lambda']:>15.6e} "
                       f"{color}{r['Reliability']:>12.6f}{Colors.ENDC}")
             
-            # Calculate group reliability (all in series)
+            # Calculate group reliability (all in series). With exponential
+            # blocks the product of R_i is exp(-sum(lambda_i) * t), which avoids
+            # multiplying many values close to 1
             lambda_total = sum(r['Lambda'] for r in results)
-            R_total = rm.series_reliability([r['Reliability'] for r in results])
+            R_total = math.exp(-lambda_total * rm.T_MISSION)
             
             print(f"{Colors.CYAN}{'-'*80}{Colors.ENDC}")
             print(f"{Colors.GREEN}{Colors.BOLD}{'SYSTEM TOTAL (Series)':<55} "
@@ -507,7 +633,8 @@ def run_block_reliability():
                 df, sheet_name,
                 ni=rm.NI, dt=rm.DT, t_mission=rm.T_MISSION,
                 pi_i=rm.PI_I, leos=rm.LEOS,
-                verbose=True
+                verbose=True,
+                block_df=sheet_frames[sheet_name]
             )
             
             if not comp_df.empty:
@@ -519,23 +646,24 @@ def run_block_reliability():
                 print(f"{Colors.BOLD}{'Reference':<15} {'Class':<35} {'Lambda (FPH)':>15} {'Reliability':>12}{Colors.ENDC}")
                 print(f"{Colors.CYAN}{'-'*80}{Colors.ENDC}")
                 
-                for idx, row in comp_df.iterrows():
-                    # Color code by reliability
-                    if pd.isna(row['Reliability']):
-                        color = Colors.RED
-                        rel_str = "N/A"
-                    elif row['Reliability'] > 0.999:
-                        color = Colors.GREEN
-                        rel_str = f"{row['Reliability']:.6f}"
-                    elif row['Reliability'] > 0.99:
-                        color = Colors.CYAN
-                        rel_str = f"{row['Reliability']:.6f}"
-                    else:
-                        color = Colors.YELLOW
-                        rel_str = f"{row['Reliability']:.6f}"
-                    
-                    print(f"{row['Reference']:<15} {row['Class']:<35} "
-                          f"{row['Failure_rate']:>15.6e} {color}{rel_str:>12}{Colors.ENDC}")
+                # Color code by reliability, for all rows at once
+                reliability = comp_df['Reliability'].to_numpy()
+                missing = np.isnan(reliability)
+                colors = np.select(
+                    [missing, reliability > 0.999, reliability > 0.99],
+                    [Colors.RED, Colors.GREEN, Colors.CYAN],
+                    Colors.YELLOW
+                )
+                rel_strs = ["N/A" if m else f"{r:.6f}" for r, m in zip(reliability, missing)]
+                
+                lines = [
+                    f"{ref:<15} {cls:<35} {lam_i:>15.6e} {color}{rel_str:>12}{Colors.ENDC}"
+                    for ref, cls, lam_i, color, rel_str in zip(
+                        comp_df['Reference'], comp_df['Class'], comp_df['Failure_rate'],
+                        colors, rel_strs
+                    )
+                ]
+                print('\n'.join(lines))
                 
                 print(f"{Colors.CYAN}{'-'*80}{Colors.ENDC}")
                 
@@ -590,6 +718,7 @@ def run_task1():
     print_info("Starting Monte Carlo analysis...")
     
     def execute():
+        import task1_monte_carlo as mc
         mc.run_monte_carlo_analysis(str(excel_file), sheet_name)
     
     if safe_execute(execute, "Monte Carlo analysis failed"):
@@ -618,6 +747,7 @@ def run_task2():
     print_info("Starting sensitivity analysis...")
     
     def execute():
+        import task2_sensitivity_analysis as sa
         sa.run_sensitivity_analysis(str(excel_file), sheet_name)
     
     if safe_execute(execute, "Sensitivity analysis failed"):
@@ -5,7 +5,15 @@ Mathematical functions for electronic component failure rate calculations
 Based on IEC standards for reliability engineering.
 """
 
+import contextlib
+import functools
+import importlib.util
+import io
 import math as mat
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
@@ -30,73 +38,222 @@ DT = 3     # Amplitude of cycles (°C)
 T_MISSION = 43800  # Mission time in hours
 PI_I = 1   # Overstress factor
 LEOS = 40  # Electrical overstress baseline
+IC_BASELINE_FIT = 40.0  # Overstress baseline added to every integrated circuit (FIT)
 
 # ============================================================================
 # COMPONENT CHARACTERISTICS (IEC Pages 33-37)
 # ============================================================================
 
+_L1 = {
+    "MOS Standard, Digital circuits, 20000 transistors": 2.7e-4,
+    "MOS Standard, Digital circuits, 810 transistors": 2.7e-4,
+    "MOS Standard, Digital circuits, 2 gates": 3.4e-6,
+    "BICMOS, STAM, Static Read Access Memory, 8-bit": 6.8e-7,
+    "MOS Asic, Gate Arrays, 12 gates": 2.0e-5,
+    "Bipolar, Linear/Digital circuit low voltage, 15 transistors": 2.7e-4,
+    "BICMOS, linear/digital circuits, high voltage, 500 transistors": 2.7e-3,
+    "Bipolar circuits, linear/digital circuits, high voltage, 5000 transistors": 2.7e-2,
+    "BICMOS, linear/digital circuits, high voltage, 20 transistors": 2.7e-3,
+    "BICMOS, linear/digital circuits, low voltage, 20 transistors": 2.7e-4
+}
+
+_L2 = {
+    "MOS Standard, Digital circuits, 20000 transistors": 20,
+    "MOS Standard, Digital circuits, 810 transistors": 20,
+    "MOS Standard, Digital circuits, 2 gates": 1.7,
+    "BICMOS, STAM, Static Read Access Memory, 8-bit": 8.8,
+    "MOS Asic, Gate Arrays, 12 gates": 10,
+    "Bipolar, Linear/Digital circuit low voltage, 15 transistors": 20,
+    "BICMOS, linear/digital circuits, high voltage, 500 transistors": 20,
+    "Bipolar circuits, linear/digital circuits, high voltage, 5000 transistors": 20,
+    "BICMOS, linear/digital circuits, high voltage, 20 transistors": 20,
+    "BICMOS, linear/digital circuits, low voltage, 20 transistors": 20
+}
+
+_N = {
+    "MOS Standard, Digital circuits, 20000 transistors": 20000,
+    "MOS Standard, Digital circuits, 810 transistors": 810,
+    "MOS Standard, Digital circuits, 2 gates": 8,
+    "BICMOS, STAM, Static Read Access Memory, 8-bit": 32,
+    "MOS Asic, Gate Arrays, 12 gates": 48,
+    "Bipolar, Linear/Digital circuit low voltage, 15 transistors": 15,
+    "BICMOS, linear/digital circuits, high voltage, 500 transistors": 500,
+    "Bipolar circuits, linear/digital circuits, high voltage, 5000 transistors": 5000,
+    "BICMOS, linear/digital circuits, high voltage, 20 transistors": 20,
+    "BICMOS, linear/digital circuits, low voltage, 20 transistors": 20
+}
+
+
 def l_1(car):
     """Lambda_1 constant based on component characteristics (IEC page 33)"""
-    characteristics = {
-        "MOS Standard, Digital circuits, 20000 transistors": 2.7e-4,
-        "MOS Standard, Digital circuits, 810 transistors": 2.7e-4,
-        "MOS Standard, Digital circuits, 2 gates": 3.4e-6,
-        "BICMOS, STAM, Static Read Access Memory, 8-bit": 6.8e-7,
-        "MOS Asic, Gate Arrays, 12 gates": 2.0e-5,
-        "Bipolar, Linear/Digital circuit low voltage, 15 transistors": 2.7e-4,
-        "BICMOS, linear/digital circuits, high voltage, 500 transistors": 2.7e-3,
-        "Bipolar circuits, linear/digital circuits, high voltage, 5000 transistors": 2.7e-2,
-        "BICMOS, linear/digital circuits, high voltage, 20 transistors": 2.7e-3,
-        "BICMOS, linear/digital circuits, low voltage, 20 transistors": 2.7e-4
-    }
-    return characteristics.get(car, 0)
+    return _L1.get(car, 0)
 
 def l_2(car):
     """Lambda_2 constant based on component characteristics (IEC page 34)"""
-    characteristics = {
-        "MOS Standard, Digital circuits, 20000 transistors": 20,
-        "MOS Standard, Digital circuits, 810 transistors": 20,
-        "MOS Standard, Digital circuits, 2 gates": 1.7,
-        "BICMOS, STAM, Static Read Access Memory, 8-bit": 8.8,
-        "MOS Asic, Gate Arrays, 12 gates": 10,
-        "Bipolar, Linear/Digital circuit low voltage, 15 transistors": 20,
-        "BICMOS, linear/digital circuits, high voltage, 500 transistors": 20,
-        "Bipolar circuits, linear/digital circuits, high voltage, 5000 transistors": 20,
-        "BICMOS, linear/digital circuits, high voltage, 20 transistors": 20,
-        "BICMOS, linear/digital circuits, low voltage, 20 transistors": 20
-    }
-    return characteristics.get(car, 0)
+    return _L2.get(car, 0)
 
 
 def N(car):
     """Number of transistors based on component type"""
-    transistor_counts = {
-        "MOS Standard, Digital circuits, 20000 transistors": 20000,
-        "MOS Standard, Digital circuits, 810 transistors": 810,
-        "MOS Standard, Digital circuits, 2 gates": 8,
-        "BICMOS, STAM, Static Read Access Memory, 8-bit": 32,
-        "MOS Asic, Gate Arrays, 12 gates": 48,
-        "Bipolar, Linear/Digital circuit low voltage, 15 transistors": 15,
-        "BICMOS, linear/digital circuits, high voltage, 500 transistors": 500,
-        "Bipolar circuits, linear/digital circuits, high voltage, 5000 transistors": 5000,
-        "BICMOS, linear/digital circuits, high voltage, 20 transistors": 20,
-        "BICMOS, linear/digital circuits, low voltage, 20 transistors": 20
-    }
-    return transistor_counts.get(car, 0)
+    return _N.get(car, 0)
+
+
+def _lookup_table(table, default=0):
+    """Keys of a lookup dict as a pandas Index, with the values in the same
+    order and default appended (position -1, returned for unknown keys)"""
+    keys = pd.Index(list(table), dtype=object)
+    values = np.append(np.array([table[key] for key in keys], dtype=np.float64), default)
+    return keys, values
+
+
+def _lookup_array(keys, lookup):
+    """Vectorized table.get(key, default) through a _lookup_table pair
+    
+    Keys are resolved to integer codes with one hash-table pass, and the
+    values fetched with a single fancy-indexing take.
+    """
+    index, values = lookup
+    keys = np.asarray(keys, dtype=object)
+    codes = index.get_indexer(keys.ravel())
+    return values.take(codes).reshape(keys.shape)
+
+
+def _pair_lookup_table(table, default=0):
+    """Two-key lookup dict as a 2-D array indexed by (row code, column code)
+    
+    Returns the first and second key as pandas Indexes and the value grid.
+    The grid has an extra last row and column filled with default, so code
+    -1 (unknown key) and pairs missing from the dict both give default.
+    """
+    rows = pd.Index(list(dict.fromkeys(key for key, _ in table)), dtype=object)
+    cols = pd.Index(list(dict.fromkeys(key for _, key in table)), dtype=object)
+    values = np.full((len(rows) + 1, len(cols) + 1), default, dtype=np.float64)
+    for (row, col), value in table.items():
+        values[rows.get_loc(row), cols.get_loc(col)] = value
+    return rows, cols, values
+
+
+def _lookup_pair_array(keys1, keys2, lookup):
+    """Vectorized table.get((key1, key2), default) through a _pair_lookup_table"""
+    rows, cols, values = lookup
+    keys1, keys2 = np.broadcast_arrays(np.asarray(keys1, dtype=object), np.asarray(keys2, dtype=object))
+    row_codes = rows.get_indexer(keys1.ravel())
+    col_codes = cols.get_indexer(keys2.ravel())
+    return values[row_codes, col_codes].reshape(keys1.shape)
+
+
+_L1_LOOKUP = _lookup_table(_L1)
+_L2_LOOKUP = _lookup_table(_L2)
+_N_LOOKUP = _lookup_table(_N)
+
+
+def l_1_vec(car):
+    """Array form of l_1: Lambda_1 for each component characteristic"""
+    return _lookup_array(car, _L1_LOOKUP)
+
+
+def l_2_vec(car):
+    """Array form of l_2: Lambda_2 for each component characteristic"""
+    return _lookup_array(car, _L2_LOOKUP)
+
+
+def N_vec(car):
+    """Array form of N: number of transistors for each component characteristic"""
+    return _lookup_array(car, _N_LOOKUP)
 
 
 # ============================================================================
-# INTEGRATED CIRCUITS (IEC 7.3, Page 31)
+# SHARED FACTORS
 # ============================================================================
 
-def pi_n_i(n_i):
-    """Cycling factor for integrated circuits"""
+@functools.lru_cache(maxsize=None)
+def _pi_n_scalar(n_i):
+    """Piecewise cycling factor for one cycle count (cached)"""
     if n_i <= 8760:
         return n_i ** 0.76
     else:
         return 1.7 * (n_i ** 0.6)
 
 
+def _pi_n_batch(n_i):
+    """Array form of the piecewise cycling factor
+    
+    A BOM holds only a handful of distinct cycle counts, so the powers are
+    evaluated once per distinct value and gathered back to every element.
+    """
+    n_i = np.asarray(n_i, dtype=np.float64)
+    unique, inverse = np.unique(n_i, return_inverse=True)
+    factor = np.where(unique <= 8760, unique ** 0.76, 1.7 * (unique ** 0.6))
+    return factor.take(inverse).reshape(n_i.shape)
+
+
+def _pi_n(n_i):
+    """Cycling factor shared by ICs, diodes, transistors, resistors, inductors
+    and converters
+    
+    Scalars go through a cache (n_i is the mission cycle count in practice),
+    arrays through _pi_n_batch.
+    """
+    if np.ndim(n_i) == 0:
+        return _pi_n_scalar(n_i)
+    return _pi_n_batch(n_i)
+
+
+# Reciprocals of the IEC reference temperatures (K) used by the Arrhenius factors
+_INV_303 = 1.0 / 303
+_INV_313 = 1.0 / 313
+_INV_328 = 1.0 / 328
+_INV_373 = 1.0 / 373
+
+
+def _arrhenius(ea, inv_t_ref, t):
+    """Arrhenius temperature factor exp(ea * (1/t_ref - 1/(273 + t)))
+    
+    Args:
+        ea: Activation energy constant (K)
+        inv_t_ref: Reciprocal of the reference temperature (1/K), one of _INV_*
+        t: Operating temperature (°C)
+    """
+    return mat.exp(ea * (inv_t_ref - (1/(273 + t))))
+
+
+def _arrhenius_array(ea, inv_t_ref, t):
+    """Array form of _arrhenius, for batched temperatures"""
+    return np.exp(ea * (inv_t_ref - (1/(273 + np.asarray(t, dtype=np.float64)))))
+
+
+@functools.lru_cache(maxsize=None)
+def _cycling_stress_scalar(n_i, dt):
+    """Thermal cycling term for scalar inputs (cached)"""
+    return _pi_n_scalar(n_i) * (dt ** 0.68)
+
+
+def _cycling_stress(n_i, dt):
+    """Thermal cycling term pi_n(n_i) * dt^0.68 shared by the package failure rates"""
+    if np.ndim(n_i) == 0 and np.ndim(dt) == 0:
+        return _cycling_stress_scalar(n_i, dt)
+    return _pi_n(n_i) * np.power(np.asarray(dt, dtype=np.float64), 0.68)
+
+
+# ============================================================================
+# INTEGRATED CIRCUITS (IEC 7.3, Page 31)
+# ============================================================================
+
+pi_n_i = _pi_n  # Cycling factor for integrated circuits
+
+
+# Circuit types using the bipolar activation energy in pi_t_i
+_BIPOLAR_IC_TYPES = frozenset({
+    "Bipolar, Linear/Digital circuit low voltage, 15 transistors",
+    "Bipolar circuits, linear/digital circuits, high voltage, 5000 transistors",
+    "BICMOS, linear/digital circuits, high voltage, 500 transistors",
+    "BICMOS, linear/digital circuits, high voltage, 20 transistors"
+})
+# Activation energy per circuit type for the array form, 3480 unless bipolar
+_IC_EA_LOOKUP = _lookup_table(dict.fromkeys(_BIPOLAR_IC_TYPES, 4640), default=3480)
+
+
+@functools.lru_cache(maxsize=4096)
 def pi_t_i(t_j, typ):
     """Temperature factor for integrated circuits
     
@@ -104,19 +261,16 @@ def pi_t_i(t_j, typ):
         t_j: Junction temperature (°C)
         typ: Circuit type
     """
-    bipolar_types = [
-        "Bipolar, Linear/Digital circuit low voltage, 15 transistors",
-        "Bipolar circuits, linear/digital circuits, high voltage, 5000 transistors",
-        "BICMOS, linear/digital circuits, high voltage, 500 transistors",
-        "BICMOS, linear/digital circuits, high voltage, 20 transistors"
-    ]
-    
-    if typ in bipolar_types:
-        return mat.exp(4640 * ((1/328) - (1/(273 + t_j))))
-    else:
-        return mat.exp(3480 * ((1/328) - (1/(273 + t_j))))
+    ea = 4640 if typ in _BIPOLAR_IC_TYPES else 3480
+    return _arrhenius(ea, _INV_328, t_j)
+
 
+# Thermal expansion coefficients (ppm/°C) by material, 0 when unknown
+_CTE = {"Epoxy": 16, "FR4": 21.5}
+_CTE_LOOKUP = _lookup_table(_CTE)
 
+
+@functools.lru_cache(maxsize=None)
 def pi_alpha(typs, typc):
     """Thermal expansion mismatch factor
     
@@ -124,11 +278,23 @@ def pi_alpha(typs, typc):
         typs: Substrate material type
         typc: Component material type
     """
-    als = 16 if typs == "Epoxy" else 0
-    alc = 21.5 if typc == "FR4" else 0
-    return 0.06 * (np.abs(als - alc) ** 1.68)
+    return 0.06 * (abs(_CTE.get(typs, 0) - _CTE.get(typc, 0)) ** 1.68)
+
+
+def pi_alpha_vec(typs, typc):
+    """Array form of pi_alpha over substrate and component material arrays"""
+    cte_s = _lookup_array(typs, _CTE_LOOKUP)
+    cte_c = _lookup_array(typc, _CTE_LOOKUP)
+    return 0.06 * np.power(np.abs(cte_s - cte_c), 1.68)
+
 
+@functools.lru_cache(maxsize=None)
+def _aging(a):
+    """Technology improvement factor exp(-0.35 * (a - 1998)) for a construction year"""
+    return mat.exp(-0.35 * (a - 1998))
 
+
+@functools.lru_cache(maxsize=4096)
 def lambda_die_i(a, car, t_j, typ):
     """Die failure rate for integrated circuits
     
@@ -138,7 +304,7 @@ def lambda_die_i(a, car, t_j, typ):
         t_j: Junction temperature
         typ: Circuit type
     """
-    return (l_1(car) * N(car) * mat.exp(-0.35 * (a - 1998)) + l_2(car)) * pi_t_i(t_j, typ)
+    return (l_1(car) * N(car) * _aging(a) + l_2(car)) * pi_t_i(t_j, typ)
 
 
 def lambda_package_i(typs, typc, n_i, dt, car2, l3):
@@ -152,38 +318,53 @@ def lambda_package_i(typs, typc, n_i, dt, car2, l3):
         car2: Package characteristics
         l3: Lambda_3 value
     """
-    return 2.75e-3 * pi_alpha(typs, typc) * pi_n_i(n_i) * (dt ** 0.68) * l3
+    return 2.75e-3 * pi_alpha(typs, typc) * _cycling_stress(n_i, dt) * l3
 
 
-def lambda_int(a, t_j, typs, typc, n_i, dt, car, car2, l3):
+def lambda_int(a, t_j, typs, typc, n_i, dt, car, car2, l3, typ=None):
     """Total failure rate for integrated circuits (IEC 7.3)
     
+    Args:
+        typ: Circuit type for the temperature factor. Table 16 names the
+            technology in the characteristics, so this defaults to car.
+    
     Returns:
         Failure rate in failures per hour
     """
-    return (lambda_die_i(a, car, t_j, car) + 
-            lambda_package_i(typs, typc, n_i, dt, car2, l3) + 40) * 1e-9
+    if typ is None:
+        typ = car
+    return (lambda_die_i(a, car, t_j, typ) + 
+            lambda_package_i(typs, typc, n_i, dt, car2, l3) + IC_BASELINE_FIT) * 1e-9
 
 
 # ============================================================================
 # DIODES (IEC 8.2 and 8.3, Pages 38-41)
 # ============================================================================
 
-def pi_n_d(n_i):
-    """Cycling factor for diodes"""
-    if n_i <= 8760:
-        return n_i ** 0.76
-    else:
-        return 1.7 * (n_i ** 0.6)
+pi_n_d = _pi_n  # Cycling factor for diodes
 
 
+@functools.lru_cache(maxsize=4096)
 def pi_t_d(t_j):
     """Temperature factor for diodes
     
     Args:
         t_j: Junction temperature (°C)
     """
-    return mat.exp(4640 * ((1/313) - (1/(273 + t_j))))
+    return _arrhenius(4640, _INV_313, t_j)
+
+
+# Base failure rates for diodes keyed by (function, power level)
+_L0_DIO = {
+    ("signal", "Power diodes (8.3)"): 0.07, ("signal", "Low power diode (8.2)"): 0.07,
+    ("recovery", "Power diodes (8.3)"): 0.7, ("recovery", "Low power diode (8.2)"): 0.1,
+    ("zener", "Power diodes (8.3)"): 0.7, ("zener", "Low power diode (8.2)"): 0.4,
+    ("transient", "Power diodes (8.3)"): 0.7, ("transient", "Low power diode (8.2)"): 2.3,
+    ("trigger", "Power diodes (8.3)"): 3, ("trigger", "Low power diode (8.2)"): 2,
+    ("gallium", "Power diodes (8.3)"): 1, ("gallium", "Low power diode (8.2)"): 0.3,
+    ("thyristors", "Power diodes (8.3)"): 3, ("thyristors", "Low power diode (8.2)"): 1
+}
+_L0_DIO_LOOKUP = _pair_lookup_table(_L0_DIO)
 
 
 def l_0_dio(car, typ):
@@ -193,19 +374,7 @@ def l_0_dio(car, typ):
         car: Diode function (signal, recovery, zener, etc.)
         typ: Diode power level (Low power diode (8.2) or Power diodes (8.3))
     """
-    rates = {
-        "signal": 0.07,
-        "recovery": {"Power diodes (8.3)": 0.7, "Low power diode (8.2)": 0.1},
-        "zener": {"Power diodes (8.3)": 0.7, "Low power diode (8.2)": 0.4},
-        "transient": {"Power diodes (8.3)": 0.7, "Low power diode (8.2)": 2.3},
-        "trigger": {"Power diodes (8.3)": 3, "Low power diode (8.2)": 2},
-        "gallium": {"Power diodes (8.3)": 1, "Low power diode (8.2)": 0.3},
-        "thyristors": {"Power diodes (8.3)": 3, "Low power diode (8.2)": 1}
-    }
-    
-    if car == "signal":
-        return rates[car]
-    return rates.get(car, {}).get(typ, 0)
+    return _L0_DIO.get((car, typ), 0)
 
 
 def lambda_die_d(car, t_j, typ):
@@ -222,7 +391,7 @@ def lambda_die_d(car, t_j, typ):
 
 def lambda_package_d(ni, dt, lb):
     """Package failure rate for diodes"""
-    return 2.75e-3 * pi_n_d(ni) * (dt ** 0.68) * lb
+    return 2.75e-3 * _cycling_stress(ni, dt) * lb
 
 
 def lambda_overstress_d(pi_i, l_eos):
@@ -245,12 +414,11 @@ def lambda_diode(car, t_j, n_i, dt, lb, pi_i, l_eos, typ):
 # TRANSISTORS (IEC 8.4 and 8.5, Pages 42-45)
 # ============================================================================
 
-def pi_n_t(n_i):
-    """Cycling factor for transistors"""
-    if n_i <= 8760:
-        return n_i ** 0.76
-    else:
-        return 1.7 * (n_i ** 0.6)
+pi_n_t = _pi_n  # Cycling factor for transistors
+
+
+# Activation energy constant by transistor technology
+_TRANSISTOR_EA = {"Bipolar": 4640, "MOS": 3480}
 
 
 def pi_t_t(t_j, typ1):
@@ -260,11 +428,10 @@ def pi_t_t(t_j, typ1):
         t_j: Junction temperature (°C)
         typ1: Transistor type (Bipolar or MOS)
     """
-    if typ1 == "Bipolar":
-        return mat.exp(4640 * ((1/373) - (1/(t_j + 273))))
-    elif typ1 == "MOS":
-        return mat.exp(3480 * ((1/373) - (1/(t_j + 273))))
-    return 0
+    ea = _TRANSISTOR_EA.get(typ1)
+    if ea is None:
+        return 0
+    return _arrhenius(ea, _INV_373, t_j)
 
 
 def l_0_trans(typ2):
@@ -276,6 +443,11 @@ def l_0_trans(typ2):
     return 0.75 if typ2 == "low" else 2
 
 
+# Upper bound on the MOS voltage stress ratios (applied / rated). Beyond it
+# the fused exponential grows by ~e^23 and would overflow for absurd inputs.
+_MAX_MOS_STRESS = 5
+
+
 def pi_s_t(typ1, mce, mice, mds, mids, mgs, migs):
     """Stress factor for transistors
     
@@ -292,11 +464,10 @@ def pi_s_t(typ1, mce, mice, mds, mids, mgs, migs):
         s = mce / mice
         return 0.22 * mat.exp(1.7 * s)
     elif typ1 == "MOS":
-        s1 = mds / mids
-        s1_factor = 0.22 * mat.exp(1.7 * s1)
-        s2 = mgs / migs
-        s2_factor = 0.22 * mat.exp(3 * s2)
-        return s1_factor * s2_factor
+        # 0.22*e^(1.7*s1) * 0.22*e^(3*s2), fused into one exp
+        s1 = min(mds / mids, _MAX_MOS_STRESS)
+        s2 = min(mgs / migs, _MAX_MOS_STRESS)
+        return 0.0484 * mat.exp(1.7 * s1 + 3 * s2)
     return 0
 
 
@@ -309,7 +480,7 @@ def lamba_die_trans(t_j, typ1, typ2, mce, mice, mds, mids, mgs, migs):
 
 def lambda_package_trans(n_i, dt, lb):
     """Package failure rate for transistors"""
-    s = pi_n_t(n_i) * (dt ** 0.68)
+    s = _cycling_stress(n_i, dt)
     return 2.75e-3 * s * lb
 
 
@@ -333,6 +504,7 @@ def lambda_transistors(n_i, t_j, typ1, typ2, dt, lb, p_I, l_eos, mce, mice, mds,
 # CAPACITORS (IEC 10.3 and 10.4, Pages 57-58)
 # ============================================================================
 
+@functools.lru_cache(maxsize=4096)
 def pi_t_c(ta, typ):
     """Temperature factor for capacitors
     
@@ -341,9 +513,9 @@ def pi_t_c(ta, typ):
         typ: Capacitor type (dielectrique or tantlum)
     """
     if typ == "dielectrique":
-        return mat.exp(1160 * ((1/303) - (1/(273 + ta))))
+        return _arrhenius(1160, _INV_303, ta)
     elif typ == "tantlum":
-        return mat.exp(1740 * ((1/303) - (1/(273 + ta))))
+        return _arrhenius(1740, _INV_303, ta)
     return 0
 
 
@@ -378,6 +550,7 @@ def lambda_capacitors(n_i, ta, dt, typ):
 # RESISTORS (IEC 11.1, Page 65)
 # ============================================================================
 
+@functools.lru_cache(maxsize=4096)
 def pi_tr(t_a, op, rp):
     """Temperature factor for resistors
     
@@ -387,15 +560,10 @@ def pi_tr(t_a, op, rp):
         rp: Rated power (W)
     """
     t_r = t_a + 85 * (op / rp)
-    return mat.exp(1740 * ((1/303) - (1/(273 + t_r))))
+    return _arrhenius(1740, _INV_303, t_r)
 
 
-def pi_nr(n_i):
-    """Cycling factor for resistors"""
-    if n_i <= 8760:
-        return n_i ** 0.76
-    else:
-        return 1.7 * (n_i ** 0.6)
+pi_nr = _pi_n  # Cycling factor for resistors
 
 
 def lambda_resistors(t_a, op, rp, dt, ni):
@@ -411,19 +579,14 @@ def lambda_resistors(t_a, op, rp, dt, ni):
     Returns:
         Failure rate in failures per hour
     """
-    return (0.1 * (pi_tr(t_a, op, rp) + 1.4e-3 * pi_nr(ni) * (dt ** 0.68))) * 1e-9
+    return (0.1 * (pi_tr(t_a, op, rp) + 1.4e-3 * _cycling_stress(ni, dt))) * 1e-9
 
 
 # ============================================================================
 # INDUCTORS AND TRANSFORMERS (IEC 12, Page 73)
 # ============================================================================
 
-def pi_n_tr(n_i):
-    """Cycling factor for inductors/transformers"""
-    if n_i <= 8760:
-        return n_i ** 0.76
-    else:
-        return 1.7 * (n_i ** 0.6)
+pi_n_tr = _pi_n  # Cycling factor for inductors/transformers
 
 
 def tr(ta, po, sur):
@@ -437,13 +600,46 @@ def tr(ta, po, sur):
     return ta + 8.2 * (po / sur)
 
 
+@functools.lru_cache(maxsize=None)
+def radiating_surface(surface_str):
+    """Radiating surface in dm² from a footprint string
+    
+    Args:
+        surface_str: Footprint dimensions in mm, formatted "W x H"
+    
+    Raises:
+        ValueError: If the string is not in the "W x H" format
+    """
+    if 'x' not in surface_str:
+        raise ValueError(f"Invalid surface format '{surface_str}'")
+    parts = surface_str.split('x')
+    try:
+        w = float(parts[0].strip())
+        h = float(parts[1].strip())
+    except ValueError:
+        raise ValueError(f"Could not parse surface '{surface_str}'") from None
+    # Surface is in mm x mm, convert to dm^2
+    return (w / 100) * (h / 100)
+
+
 def pi_t_tr(tr_temp):
     """Temperature factor for inductors/transformers
     
     Args:
         tr_temp: Radiating temperature from tr() function
     """
-    return mat.exp(1740 * (1/303 - 1/(tr_temp + 273)))
+    return _arrhenius(1740, _INV_303, tr_temp)
+
+
+# Base failure rates for inductors/transformers keyed by (type, subtype)
+_L0_IND = {
+    ("inductor", "low fixed"): 0.2,
+    ("inductor", "low variable"): 0.4,
+    ("inductor", "Power Inductor"): 0.6,
+    ("tranformer", "signal"): 1.5,
+    ("tranformer", "power"): 3
+}
+_L0_IND_LOOKUP = _pair_lookup_table(_L0_IND)
 
 
 def l_0_i(typ1, typ2):
@@ -453,18 +649,7 @@ def l_0_i(typ1, typ2):
         typ1: Component type (inductor or tranformer)
         typ2: Subtype (low fixed, low variable, Power Inductor, signal, power)
     """
-    rates = {
-        "inductor": {
-            "low fixed": 0.2,
-            "low variable": 0.4,
-            "Power Inductor": 0.6
-        },
-        "tranformer": {
-            "signal": 1.5,
-            "power": 3
-        }
-    }
-    return rates.get(typ1, {}).get(typ2, 0)
+    return _L0_IND.get((typ1, typ2), 0)
 
 
 def lambda_inductors(typ1, typ2, n_i, dt, ta, po, sur):
@@ -483,7 +668,7 @@ def lambda_inductors(typ1, typ2, n_i, dt, ta, po, sur):
         Failure rate in failures per hour
     """
     s1 = pi_t_tr(tr(ta, po, sur))
-    s2 = pi_n_tr(n_i) * (dt ** 0.68)
+    s2 = _cycling_stress(n_i, dt)
     return (l_0_i(typ1, typ2) * (s1 + 7e-3 * s2)) * 1e-9
 
 
@@ -509,12 +694,7 @@ def lambda_primary(typ):
 # CONVERTERS (IEC 19.6, Page 90)
 # ============================================================================
 
-def pi_n_co(n_i):
-    """Cycling factor for converters"""
-    if n_i <= 8760:
-        return n_i ** 0.76
-    else:
-        return 1.7 * (n_i ** 0.6)
+pi_n_co = _pi_n  # Cycling factor for converters
 
 
 def lambda_converters(W, n_i, dt):
@@ -529,14 +709,174 @@ def lambda_converters(W, n_i, dt):
         Failure rate in failures per hour
     """
     l_0 = 100 if W == "W<10" else 130
-    s = pi_n_co(n_i) * (dt ** 0.68)
+    s = _cycling_stress(n_i, dt)
     return (l_0 * (1 + 3e-3 * s)) * 1e-9
 
 
+# ============================================================================
+# VECTORIZED FAILURE RATES
+#
+# Array forms of the lambda_* functions above: every argument may be a scalar
+# or an array (broadcast together) and one failure rate is returned per
+# element, in failures per hour. Type arguments are compared as strings.
+# Division by zero gives NaN instead of raising.
+# ============================================================================
+
+def _ratio(num, den):
+    """Elementwise num / den, NaN where the denominator is zero"""
+    num = np.asarray(num, dtype=np.float64)
+    den = np.asarray(den, dtype=np.float64)
+    return np.where(den == 0, np.nan, num / np.where(den == 0, 1, den))
+
+
+def lambda_int_vec(a, t_j, typs, typc, n_i, dt, car, car2, l3, typ=None):
+    """Array form of lambda_int (integrated circuits, IEC 7.3)"""
+    car = np.asarray(car, dtype=object)
+    l1 = l_1_vec(car)
+    l2 = l_2_vec(car)
+    n = N_vec(car)
+    ea = _lookup_array(car if typ is None else typ, _IC_EA_LOOKUP)
+    
+    a = np.asarray(a, dtype=np.float64)
+    l3 = np.asarray(l3, dtype=np.float64)
+    die = (l1 * n * np.exp(-0.35 * (a - 1998)) + l2) * _arrhenius_array(ea, _INV_328, t_j)
+    
+    package = 2.75e-3 * pi_alpha_vec(typs, typc) * _cycling_stress(n_i, dt) * l3
+    # Accumulate in place: one result buffer instead of a temporary per term
+    total = die + package
+    total += IC_BASELINE_FIT
+    total *= 1e-9
+    return total
+
+
+def lambda_diode_vec(car, t_j, n_i, dt, lb, pi_i, l_eos, typ):
+    """Array form of lambda_diode (diodes, IEC 8.2 and 8.3)"""
+    car = np.asarray(car, dtype=object)
+    pi_u = np.where(car == "thyristors", 10, 1)
+    die = pi_u * _lookup_pair_array(car, typ, _L0_DIO_LOOKUP) * _arrhenius_array(4640, _INV_313, t_j)
+    package = 2.75e-3 * _cycling_stress(n_i, dt) * np.asarray(lb, dtype=np.float64)
+    return (die + package + np.multiply(pi_i, l_eos)) * 1e-9
+
+
+def _pi_s_bipolar(mce, mice):
+    """Array form of pi_s_t for bipolar transistors: 0.22*e^(1.7*S_CE)"""
+    return 0.22 * np.exp(1.7 * _ratio(mce, mice))
+
+
+def _pi_s_mos(mds, mids, mgs, migs):
+    """Array form of pi_s_t for MOS transistors, with the two factors fused:
+    0.22*e^(1.7*S_DS) * 0.22*e^(3*S_GS) = 0.0484*e^(1.7*S_DS + 3*S_GS)"""
+    s_ds = np.minimum(_ratio(mds, mids), _MAX_MOS_STRESS)
+    s_gs = np.minimum(_ratio(mgs, migs), _MAX_MOS_STRESS)
+    return 0.0484 * np.exp(1.7 * s_ds + 3 * s_gs)
+
+
+def lambda_transistors_vec(n_i, t_j, typ1, typ2, dt, lb, p_I, l_eos, mce, mice, mds, mids, mgs, migs):
+    """Array form of lambda_transistors (transistors, IEC 8.4 and 8.5)"""
+    typ1, mce, mice, mds, mids, mgs, migs = np.broadcast_arrays(
+        np.asarray(typ1, dtype=object),
+        *(np.asarray(v, dtype=np.float64) for v in (mce, mice, mds, mids, mgs, migs))
+    )
+    is_mos = typ1 == "MOS"
+    is_bipolar = typ1 == "Bipolar"
+    l_0 = np.where(np.asarray(typ2, dtype=object) == "low", 0.75, 2)
+    
+    ea = np.where(is_mos, _TRANSISTOR_EA["MOS"], _TRANSISTOR_EA["Bipolar"])
+    pi_t = _arrhenius_array(ea, _INV_373, t_j)
+    # Partition by type once; each specialized kernel only sees its own rows
+    pi_s = np.zeros(typ1.shape)
+    pi_s[is_bipolar] = _pi_s_bipolar(mce[is_bipolar], mice[is_bipolar])
+    pi_s[is_mos] = _pi_s_mos(mds[is_mos], mids[is_mos], mgs[is_mos], migs[is_mos])
+    die = np.where(is_mos | is_bipolar, pi_s * l_0 * pi_t, 0.0)
+    package = 2.75e-3 * _cycling_stress(n_i, dt) * np.asarray(lb, dtype=np.float64)
+    total = die + package + np.multiply(p_I, l_eos)
+    total *= 1e-9
+    return total
+
+
+@dataclass
+class ComponentArray:
+    """Struct-of-arrays batch of components for the *_batch kernels
+    
+    Each field holds one value per component, aligned by position, or a
+    scalar shared by the whole batch. Applied voltages default to 0 over a
+    rating of 1, i.e. no electrical stress.
+    """
+    t_j: np.ndarray                 # Junction temperature (°C)
+    typ1: np.ndarray                # Technology (MOS / Bipolar)
+    typ2: np.ndarray                # Power level (low / not low)
+    lb: np.ndarray                  # Package base failure rate (l_b)
+    n_i: np.ndarray = NI            # Cycles per year
+    dt: np.ndarray = DT             # Cycle amplitude (°C)
+    pi_i: np.ndarray = PI_I         # Overstress factor
+    l_eos: np.ndarray = LEOS        # Electrical overstress baseline
+    mce: np.ndarray = 0             # Max repetitive VCE
+    mice: np.ndarray = 1            # Min specified VCE
+    mds: np.ndarray = 0             # Max applied VDS
+    mids: np.ndarray = 1            # Min specified VDS
+    mgs: np.ndarray = 0             # Max applied VGS
+    migs: np.ndarray = 1            # Min specified VGS
+
+
+def lambda_transistors_batch(c):
+    """Failure rates of a ComponentArray of transistors (IEC 8.4 and 8.5)
+    
+    Args:
+        c: ComponentArray holding the transistor parameters
+    
+    Returns:
+        Float array of failure rates in failures per hour
+    """
+    return lambda_transistors_vec(
+        c.n_i, c.t_j, c.typ1, c.typ2, c.dt, c.lb, c.pi_i, c.l_eos,
+        c.mce, c.mice, c.mds, c.mids, c.mgs, c.migs
+    )
+
+
+def lambda_capacitors_vec(n_i, ta, dt, typ):
+    """Array form of lambda_capacitors (capacitors, IEC 10.3 and 10.4)"""
+    typ = np.asarray(typ, dtype=object)
+    s2 = np.asarray(n_i, dtype=np.float64) ** 0.76 * np.power(np.asarray(dt, dtype=np.float64), 0.68)
+    dielectric = 0.15 * (_arrhenius_array(1160, _INV_303, ta) + 3.3e-3 * s2)
+    tantalum = 0.4 * (_arrhenius_array(1740, _INV_303, ta) + 3.8e-3 * s2)
+    return np.select([typ == "dielectrique", typ == "tantlum"], [dielectric, tantalum], 0.0) * 1e-9
+
+
+def lambda_resistors_vec(t_a, op, rp, dt, ni):
+    """Array form of lambda_resistors (resistors, IEC 11.1)"""
+    t_r = np.asarray(t_a, dtype=np.float64) + 85 * _ratio(op, rp)
+    return (0.1 * (_arrhenius_array(1740, _INV_303, t_r) + 1.4e-3 * _cycling_stress(ni, dt))) * 1e-9
+
+
+def lambda_inductors_vec(typ1, typ2, n_i, dt, ta, po, sur):
+    """Array form of lambda_inductors (inductors/transformers, IEC 12)"""
+    t_r = np.asarray(ta, dtype=np.float64) + 8.2 * _ratio(po, sur)
+    s1 = _arrhenius_array(1740, _INV_303, t_r)
+    s2 = _cycling_stress(n_i, dt)
+    return (_lookup_pair_array(typ1, typ2, _L0_IND_LOOKUP) * (s1 + 7e-3 * s2)) * 1e-9
+
+
+def lambda_converters_vec(W, n_i, dt):
+    """Array form of lambda_converters (converters, IEC 19.6)"""
+    l_0 = np.where(np.asarray(W, dtype=object) == "W<10", 100, 130)
+    return (l_0 * (1 + 3e-3 * _cycling_stress(n_i, dt))) * 1e-9
+
+
 # ============================================================================
 # RELIABILITY CALCULATION FUNCTIONS
 # ============================================================================
 
+# Lambda_B by package type (IEC page 37), 1.0 when not listed
+_PACKAGE_LAMBDA_B = {
+    "D2PACK, 3 pins": 5.7,
+    "SOT-23, 3 pins": 1.0,
+    "SOD-123, 3 pins": 1.0,
+    "TO-220, 3 pins": 5.7,
+    "DPACK, 6 pins": 5.1,
+    "TO-247, 3 pins": 6.9
+}
+
+
 def l_b(package_type):
     """
     Lambda_B for package types (IEC page 37)
@@ -547,22 +887,18 @@ def l_b(package_type):
     Returns:
         Lambda_B value for the package
     """
-    # Clean up the input string
-    if pd.isna(package_type):
+    # Empty cell: None, NaN (the only value not equal to itself) or pd.NA
+    if package_type is None or package_type is pd.NA or package_type != package_type:
         return 1.0
     
-    pkg = str(package_type).strip()
-    
-    package_values = {
-        "D2PACK, 3 pins": 5.7,
-        "SOT-23, 3 pins": 1.0,
-        "SOD-123, 3 pins": 1.0,
-        "TO-220, 3 pins": 5.7,
-        "DPACK, 6 pins": 5.1,
-        "TO-247, 3 pins": 6.9
-    }
-    
-    return package_values.get(pkg, 1.0)  # Default to 1.0 if not found
+    # Clean up the input string
+    return _PACKAGE_LAMBDA_B.get(str(package_type).strip(), 1.0)  # Default to 1.0 if not found
+
+
+def l_b_vec(package_types):
+    """Array form of l_b over a Series (or array) of Table 18 package types"""
+    packages = pd.Series(package_types, dtype=object).astype('string').str.strip()
+    return packages.map(_PACKAGE_LAMBDA_B).fillna(1.0).to_numpy(dtype=np.float64)
 
 
 def reliability_from_lambda(lambda_value, t):
@@ -578,6 +914,24 @@ def reliability_from_lambda(lambda_value, t):
     return mat.exp(-lambda_value * t)
 
 
+def reliability_from_lambda_approx(lambda_value, t):
+    """Second-order approximation of reliability_from_lambda
+    
+    exp(-x) ~ 1 - x + x^2/2 with x = lambda * t. The error is below x^3/6,
+    i.e. under 2e-10 while lambda * t stays below 1e-3 (the usual regime for
+    a single component over a mission). Works on scalars and arrays.
+    
+    Args:
+        lambda_value: Failure rate (failures per hour)
+        t: Time (hours)
+    
+    Returns:
+        Approximate reliability (probability of survival)
+    """
+    lt = lambda_value * t
+    return 1.0 - lt + 0.5 * lt * lt
+
+
 def series_reliability(R_list):
     """Calculate reliability of components in series (all must work)
     
@@ -587,10 +941,7 @@ def series_reliability(R_list):
     Returns:
         System reliability
     """
-    R = 1.0
-    for r in R_list:
-        R *= r
-    return R
+    return float(np.prod(np.asarray(R_list, dtype=np.float64)))
 
 
 def parallel_reliability(R_list):
@@ -602,18 +953,500 @@ def parallel_reliability(R_list):
     Returns:
         System reliability
     """
-    P_fail = 1.0
-    for r in R_list:
-        P_fail *= (1 - r)
-    return 1.0 - P_fail
+    # 1 - prod(1 - r) evaluated in log space, so that tiny failure
+    # probabilities neither underflow nor lose precision
+    R = np.asarray(R_list, dtype=np.float64)
+    with np.errstate(divide='ignore'):  # r == 1 gives log(0) = -inf, i.e. R = 1
+        return float(0.0 - np.expm1(np.sum(np.log1p(-R))))
+
+
+# ============================================================================
+# DATA LOADING
+# ============================================================================
+
+# Optional fast Excel reader (pandas gained the 'calamine' engine in 2.2)
+_HAS_CALAMINE = (
+    importlib.util.find_spec('python_calamine') is not None
+    and tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2)
+)
+
+# Columns read by the block reliability calculation (identification + IEC inputs)
+COMPONENT_COLUMNS = (
+    'Reference', 'Sheet', 'Class',
+    'Temperature_Junction', 'Temperature_Ambiant',
+    'Transistor type', 'Table 18',
+    'Max repetitive VCE', 'Min specified VCE',
+    'Max applied VDS', 'Min specified VDS',
+    'Max applied VGS', 'Min specified VGS',
+    'Operating_Power', 'Rated_Power',
+    'Power loss', 'Radiating surface', 'Inductor type',
+    'diode_type',
+    'Construction Date', 'alpha_s', 'alpha_c', 'Table 16', 'Table 17a', 'Lam3'
+)
+
+
+def _excel_engine(path):
+    """
+    pandas engine used to read a workbook.
+    
+    calamine (python-calamine, pandas >= 2.2) parses .xlsx and .xls files
+    several times faster than the pure-Python readers and is used when
+    installed. Otherwise openpyxl streams .xlsx workbooks in read-only,
+    values-only mode, and legacy .xls files are left to pandas' engine
+    detection (xlrd).
+    """
+    if _HAS_CALAMINE:
+        return 'calamine'
+    return 'openpyxl' if path.lower().endswith(('.xlsx', '.xlsm')) else None
+
+
+def _parse_workbook(path):
+    """Parse the component sheet ('Board3' if present, otherwise the first one)"""
+    with pd.ExcelFile(path, engine=_excel_engine(path)) as xls:
+        sheet = 'Board3' if 'Board3' in xls.sheet_names else 0
+        df = xls.parse(sheet)
+    # Columns mixing numbers and text (e.g. Rated_Power with '10W') are kept
+    # as text so the table has one type per column; numeric readers coerce them
+    for name in df.columns[df.dtypes == object]:
+        values = df[name]
+        if len({type(v) for v in values.dropna()}) > 1:
+            df[name] = values.map(lambda v: v if pd.isna(v) else str(v))
+    return df
+
+
+def _sidecar_path(path):
+    """Parquet copy of a workbook, stored next to it as '.<name>.parquet'"""
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.parquet")
+
+
+@functools.lru_cache(maxsize=2)
+def _load_workbook_table(path, mtime):
+    """
+    Full component table of a workbook, via its Parquet sidecar when possible.
+    
+    Cached on (path, mtime) so that loads of different column subsets share
+    one parse. The sidecar is only an accelerator: it is used when it is at
+    least as recent as the workbook, and any failure to read or write it (no
+    Parquet engine installed, read-only directory, damaged file) falls back
+    to parsing the workbook.
+    """
+    sidecar = _sidecar_path(path)
+    try:
+        if os.path.getmtime(sidecar) >= mtime:
+            return pd.read_parquet(sidecar)
+    except Exception:
+        pass
+    
+    df = _parse_workbook(path)
+    try:
+        df.to_parquet(sidecar)
+    except Exception:
+        if os.path.exists(sidecar):
+            try:
+                os.remove(sidecar)
+            except OSError:
+                pass
+    return df
+
+
+# Low-cardinality label columns stored as pandas categoricals
+_CATEGORY_COLUMNS = ('Sheet', 'Class', 'Transistor type', 'Inductor type', 'diode_type')
+
+
+@functools.lru_cache(maxsize=4)
+def _read_components(path, mtime, columns):
+    """Component table restricted to columns (cached on path, modification time and columns)"""
+    df = _load_workbook_table(path, mtime)
+    if columns is not None:
+        df = df[[name for name in df.columns if name in columns]]
+    df = df.copy()
+    # Block paths and type labels repeat on every component row: store them
+    # as categories so grouping and comparisons work on integer codes
+    for name in _CATEGORY_COLUMNS:
+        if name in df.columns:
+            df[name] = df[name].astype('category')
+    return df
+
+
+def load_components(excel_file, columns=COMPONENT_COLUMNS):
+    """
+    Load the component table from an Excel file.
+    
+    The parsed DataFrame is cached, so repeated calls for the same file (menu
+    options, per-block loops, sensitivity sweeps) only parse the workbook once.
+    The cache is invalidated when the file is modified on disk.
+    
+    Args:
+        excel_file: Path to the Excel file
+        columns: Columns to keep (those absent from the file are ignored),
+                 or None to read every column
+    
+    Returns:
+        DataFrame with one row per component. The frame is shared between
+        callers and must not be modified in place.
+    """
+    path = os.path.abspath(excel_file)
+    if columns is not None:
+        columns = frozenset(columns)
+    return _read_components(path, os.path.getmtime(path), columns)
+
+
+@functools.lru_cache(maxsize=4)
+def _group_components(path, mtime, columns):
+    """Split the cached component table into one frame per block"""
+    df = _read_components(path, mtime, columns)
+    return {sheet: group for sheet, group in df.groupby('Sheet', sort=False, observed=True)}
+
+
+def load_block_frames(excel_file, columns=COMPONENT_COLUMNS):
+    """
+    Load the component table from an Excel file, split by block.
+    
+    Cached like load_components, so the grouping is done once per file
+    version and reused by every later menu run.
+    
+    Args:
+        excel_file: Path to the Excel file (must have a 'Sheet' column)
+        columns: Columns to keep, as for load_components
+    
+    Returns:
+        Dictionary mapping each block name (Sheet value) to its component
+        rows. The frames are shared and must not be modified in place.
+    """
+    path = os.path.abspath(excel_file)
+    if columns is not None:
+        columns = frozenset(columns)
+    return _group_components(path, os.path.getmtime(path), columns)
 
 
 # ============================================================================
 # BLOCK RELIABILITY CALCULATION
 # ============================================================================
 
+# Number of data quality messages printed per block
+MAX_PRINTED_ERRORS = 10
+
+class _ErrorLog:
+    """Error message collector that keeps only the first messages and counts the rest"""
+    
+    def __init__(self, limit=MAX_PRINTED_ERRORS):
+        self.limit = limit
+        self.messages = []
+        self.count = 0
+    
+    def append(self, message):
+        self.count += 1
+        if len(self.messages) < self.limit:
+            self.messages.append(message)
+    
+    def extend(self, messages):
+        for message in messages:
+            self.append(message)
+    
+    def __len__(self):
+        return self.count
+
+
+def _column(sub, name, default=np.nan, overrides=None):
+    """Numeric column as a float array, with empty cells replaced by default
+    
+    Non-numeric cells become NaN so they surface as calculation errors.
+    Values in overrides[name] (one per row, possibly with leading sample
+    axes) replace the column; NaN entries there also take the default.
+    """
+    if overrides is not None and name in overrides:
+        values = np.asarray(overrides[name], dtype=np.float64)
+        return np.where(np.isnan(values), default, values)
+    if name not in sub:
+        return np.full(len(sub), default, dtype=np.float64)
+    raw = sub[name]
+    values = pd.to_numeric(raw, errors='coerce').to_numpy(dtype=np.float64)
+    return np.where(raw.isna().to_numpy(), default, values)
+
+
+def _str_column(sub, name, default=''):
+    """Column as an object Series, or a Series filled with default if absent"""
+    if name not in sub:
+        return pd.Series(default, index=sub.index, dtype=object)
+    return sub[name].astype(object)
+
+
+def _check_required(sub, refs, required, errors, prefix="Missing "):
+    """Record missing required parameters and return the mask of complete rows"""
+    missing = np.column_stack([
+        sub[name].isna().to_numpy() if name in sub else np.ones(len(sub), dtype=bool)
+        for name in required
+    ])
+    for i in np.flatnonzero(missing.any(axis=1)):
+        names = [name for name, m in zip(required, missing[i]) if m]
+        errors.append(f"{refs[i]}: {prefix}{', '.join(names)}")
+    return ~missing.any(axis=1)
+
+
+def _package_lambda(sub, overrides=None):
+    """Lambda_B per row from 'Table 18', or the 'LamB' override values"""
+    if overrides is not None and 'LamB' in overrides:
+        return np.asarray(overrides['LamB'], dtype=np.float64)
+    return l_b_vec(_str_column(sub, 'Table 18', None))
+
+
+# ----------------------------------------------------------------------------
+# Per-class block evaluation
+#
+# Each handler receives every row of one component class at once and returns
+# the failure rates as an array, 0 where required parameters are missing.
+# overrides maps column names (and 'LamB') to replacement values aligned with
+# the rows of sub; with sampled values the result gains their leading axes.
+# Signature: handler(component_class, sub, refs, errors, ni, dt, pi_i, leos, overrides)
+# ----------------------------------------------------------------------------
+
+def _block_transistors(component_class, sub, refs, errors, ni, dt, pi_i, leos, overrides=None):
+    """Low power and power transistors (IEC 8.4 and 8.5)"""
+    is_mos = _str_column(sub, 'Transistor type').astype(str).str.contains('MOS', regex=False).to_numpy(dtype=bool)
+    typ2 = "low" if component_class == 'Low Power transistor (8.4)' else "not low"
+    
+    # Check for required temperature
+    valid = _check_required(sub, refs, ['Temperature_Junction'], errors)
+    
+    # Get package lambda value
+    lb = _package_lambda(sub, overrides)
+    
+    # Get voltage parameters (can default to 0 if NaN)
+    batch = ComponentArray(
+        t_j=_column(sub, 'Temperature_Junction', overrides=overrides), typ1=np.where(is_mos, "MOS", "Bipolar"),
+        typ2=typ2, lb=lb, n_i=ni, dt=dt, pi_i=pi_i, l_eos=leos,
+        mce=_column(sub, 'Max repetitive VCE', 0, overrides=overrides), mice=_column(sub, 'Min specified VCE', 1, overrides=overrides),
+        mds=_column(sub, 'Max applied VDS', 0, overrides=overrides), mids=_column(sub, 'Min specified VDS', 1, overrides=overrides),
+        mgs=_column(sub, 'Max applied VGS', 0, overrides=overrides), migs=_column(sub, 'Min specified VGS', 1, overrides=overrides)
+    )
+    return np.where(valid, lambda_transistors_batch(batch), 0.0)
+
+
+def _block_capacitors(component_class, sub, refs, errors, ni, dt, pi_i, leos, overrides=None):
+    """Ceramic and tantalum capacitors (IEC 10.3 and 10.4)"""
+    valid = _check_required(sub, refs, ['Temperature_Ambiant'], errors)
+    typ = "dielectrique" if component_class == 'Ceramic Capacitor (10.3)' else "tantlum"
+    lam = lambda_capacitors_vec(ni, _column(sub, 'Temperature_Ambiant', overrides=overrides), dt, typ)
+    return np.where(valid, lam, 0.0)
+
+
+def _block_resistors(component_class, sub, refs, errors, ni, dt, pi_i, leos, overrides=None):
+    """Resistors (IEC 11.1)"""
+    valid = _check_required(sub, refs, ['Temperature_Ambiant', 'Operating_Power', 'Rated_Power'], errors)
+    lam = lambda_resistors_vec(
+        _column(sub, 'Temperature_Ambiant', overrides=overrides), _column(sub, 'Operating_Power', overrides=overrides),
+        _column(sub, 'Rated_Power', overrides=overrides), dt, ni
+    )
+    return np.where(valid, lam, 0.0)
+
+
+def _block_inductors(component_class, sub, refs, errors, ni, dt, pi_i, leos, overrides=None):
+    """Inductors (IEC 12)"""
+    valid = _check_required(sub, refs, ['Temperature_Ambiant', 'Power loss', 'Radiating surface'], errors)
+    
+    # Parse radiating surface "W x H" (mm) for the whole column at once
+    surfaces = _str_column(sub, 'Radiating surface').fillna('').astype(str)
+    head = surfaces.str.partition('x')
+    w = pd.to_numeric(head[0].str.strip(), errors='coerce').to_numpy(dtype=np.float64)
+    h = pd.to_numeric(head[2].str.partition('x')[0].str.strip(), errors='coerce').to_numpy(dtype=np.float64)
+    parsed = np.where((head[1] == 'x').to_numpy(), (w / 100) * (h / 100), np.nan)
+    sur = np.where(valid, parsed, 0.0132)  # Fallback
+    
+    # Rows the column parse rejected go through radiating_surface for the error message
+    for i in np.flatnonzero(valid & np.isnan(parsed)):
+        try:
+            sur[i] = radiating_surface(surfaces.iat[i])
+        except ValueError as e:
+            sur[i] = 0.0132
+            errors.append(f"{refs[i]}: {e}")
+    
+    typ2 = sub['Inductor type'].to_numpy(dtype=object) if 'Inductor type' in sub else "Power Inductor"
+    lam = lambda_inductors_vec(
+        "inductor", typ2, ni, dt,
+        _column(sub, 'Temperature_Ambiant', overrides=overrides), _column(sub, 'Power loss', overrides=overrides), sur
+    )
+    return np.where(valid, lam, 0.0)
+
+
+def _block_converters(component_class, sub, refs, errors, ni, dt, pi_i, leos, overrides=None):
+    """Converters (IEC 19.6)"""
+    W = "W<10" if component_class == 'Converter <10W (19.6)' else "W>10"
+    return np.full(len(sub), lambda_converters(W, ni, dt))
+
+
+def _block_diodes(component_class, sub, refs, errors, ni, dt, pi_i, leos, overrides=None):
+    """Low power and power diodes (IEC 8.2 and 8.3)"""
+    valid = _check_required(sub, refs, ['diode_type', 'Temperature_Junction'], errors)
+    diode_type = sub['diode_type'].to_numpy(dtype=object) if 'diode_type' in sub else np.full(len(sub), np.nan, dtype=object)
+    
+    # Get package lambda value
+    lb = _package_lambda(sub, overrides)
+    
+    lam = lambda_diode_vec(
+        diode_type, _column(sub, 'Temperature_Junction', overrides=overrides), ni, dt, lb, pi_i, leos, component_class
+    )
+    return np.where(valid, lam, 0.0)
+
+
+def _block_batteries(component_class, sub, refs, errors, ni, dt, pi_i, leos, overrides=None):
+    """Primary batteries (IEC 19.1)"""
+    return np.full(len(sub), lambda_primary(component_class))
+
+
+def _block_integrated_circuits(component_class, sub, refs, errors, ni, dt, pi_i, leos, overrides=None):
+    """Integrated circuits (IEC 7.3)"""
+    # Only calculate if we have all required data
+    valid = _check_required(
+        sub, refs,
+        ['Construction Date', 'Temperature_Junction', 'alpha_s', 'alpha_c', 'Table 16', 'Table 17a'],
+        errors, prefix="Missing required IC parameters: "
+    )
+    lam = lambda_int_vec(
+        _column(sub, 'Construction Date', overrides=overrides), _column(sub, 'Temperature_Junction', overrides=overrides),
+        sub['alpha_s'].to_numpy(dtype=object), sub['alpha_c'].to_numpy(dtype=object),
+        ni, dt, sub['Table 16'].to_numpy(dtype=object), sub['Table 17a'].to_numpy(dtype=object),
+        _column(sub, 'Lam3', 1.3, overrides=overrides)  # Lam3 is optional, has reasonable default
+    )
+    return np.where(valid, lam, 0.0)
+
+
+# Component class (Excel 'Class' column) -> block handler
+_CLASS_HANDLERS = {
+    'Low Power transistor (8.4)': _block_transistors,
+    'Power Transistor (8.5)': _block_transistors,
+    'Ceramic Capacitor (10.3)': _block_capacitors,
+    'Tantlum Capacitor (10.4)': _block_capacitors,
+    'Resistor (11.1)': _block_resistors,
+    'Inductor (12)': _block_inductors,
+    'Converter <10W (19.6)': _block_converters,
+    'Converter >10W (19.6)': _block_converters,
+    'Low power diode (8.2)': _block_diodes,
+    'Power diodes (8.3)': _block_diodes,
+    'Primary batteries (19.1)': _block_batteries,
+    'Integrated Circuit (7)': _block_integrated_circuits,
+}
+
+
+def _component_lambdas(block_df, references, errors, verbose, ni, dt, pi_i, leos,
+                       overrides=None):
+    """
+    Failure rate of every row of a block, one vectorized handler call per class.
+    
+    Rows that cannot be evaluated get 0. With overrides whose arrays carry
+    leading sample axes, e.g. (n_samples, n_components), the result has the
+    same shape and each sample row is evaluated in the same handler call.
+    """
+    sample_shape = ()
+    if overrides:
+        sample_shape = np.shape(next(iter(overrides.values())))[:-1]
+    lambdas = np.zeros(sample_shape + (len(block_df),))
+    
+    # Row positions of each class (NaN classes are dropped by groupby)
+    class_positions = block_df.groupby('Class', sort=False, observed=True).indices
+    for component_class, positions in class_positions.items():
+        if component_class == '':
+            continue
+        sub = block_df.iloc[positions]
+        refs = references[positions]
+        handler = _CLASS_HANDLERS.get(component_class)
+        
+        if handler is None:
+            if verbose:
+                errors.extend(f"Unknown class '{component_class}' for {ref}" for ref in refs)
+            continue
+        
+        sub_overrides = None
+        if overrides:
+            sub_overrides = {name: np.asarray(values)[..., positions] for name, values in overrides.items()}
+        
+        # Handlers mask out rows with missing parameters themselves
+        with np.errstate(all='ignore'):
+            lam = handler(component_class, sub, refs, errors, ni, dt, pi_i, leos, sub_overrides)
+        
+        # Invalid inputs (zero rated power, non-numeric cells, overflow) give a non-finite lambda
+        bad = ~np.isfinite(lam)
+        if bad.any():
+            if verbose:
+                bad_rows = bad.reshape(-1, len(positions)).any(axis=0)
+                errors.extend(f"Error calculating lambda for {ref}: non-finite failure rate" for ref in refs[bad_rows])
+            lam = np.where(bad, 0.0, lam)
+        
+        lambdas[..., positions] = lam
+    
+    return lambdas
+
+
+# Parameters with uncertain values (Monte Carlo inputs)
+SAMPLED_PARAMETERS = ('LamB', 'Lam3', 'Max applied VDS', 'Max repetitive VCE', 'Operating_Power')
+
+
+def nominal_parameters(block_df, names=SAMPLED_PARAMETERS):
+    """
+    Nominal values of parameters that can be overridden with samples.
+    
+    Args:
+        block_df: Rows of one block
+        names: Parameters to return: 'LamB' (package lambda from 'Table 18')
+               or any numeric column
+    
+    Returns:
+        Dict of float arrays aligned with the rows of block_df, with the raw
+        column values (NaN where empty or absent)
+    """
+    params = {}
+    for name in names:
+        if name == 'LamB':
+            params[name] = l_b_vec(_str_column(block_df, 'Table 18', None))
+        else:
+            params[name] = _column(block_df, name)
+    return params
+
+
+def _reference_overrides(block_df, references, parameter_overrides):
+    """
+    Column overrides for {reference: {parameter: value}} replacements.
+    
+    Each overridden parameter gets a full column starting from the nominal
+    values (see nominal_parameters) with the given references replaced.
+    References that are not in the block are ignored.
+    """
+    overrides = {}
+    for reference, values in parameter_overrides.items():
+        mask = references == reference
+        for name, value in values.items():
+            if name not in overrides:
+                nominal = (l_b_vec(_str_column(block_df, 'Table 18', None)) if name == 'LamB'
+                           else _column(block_df, name))
+                overrides[name] = np.array(nominal, dtype=np.float64)
+            overrides[name][mask] = value
+    return overrides
+
+
+def sample_block_lambdas(block_df, overrides, ni=NI, dt=DT, pi_i=PI_I, leos=LEOS):
+    """
+    Component failure rates for many parameter samples in one pass.
+    
+    Args:
+        block_df: Rows of one block
+        overrides: {column name or 'LamB': array (n_samples, n_components)};
+                   NaN entries fall back to the column defaults
+        ni: Number of cycles per year
+        dt: Temperature cycle amplitude (°C)
+        pi_i: Overstress factor
+        leos: Electrical overstress baseline
+    
+    Returns:
+        Array (n_samples, n_components) of failure rates (failures/hour),
+        0 for components that cannot be evaluated
+    """
+    references = block_df['Reference'].to_numpy()
+    return _component_lambdas(block_df, references, [], False, ni, dt, pi_i, leos, overrides)
+
+
 def calculate_block_reliability(df, sheet_name, ni=NI, dt=DT, t_mission=T_MISSION, 
-                                pi_i=PI_I, leos=LEOS, verbose=True):
+                                pi_i=PI_I, leos=LEOS, verbose=True, return_df=True,
+                                block_df=None, parameter_overrides=None):
     """
     Calculate reliability for a specific block/sheet.
     
@@ -630,288 +1463,148 @@ def calculate_block_reliability(df, sheet_name, ni=NI, dt=DT, t_mission=T_MISSIO
         pi_i: Overstress factor
         leos: Electrical overstress baseline
         verbose: Print progress messages
+        return_df: Build the per-component DataFrame; if False, the component
+                   count is returned in its place
+        block_df: Rows of the block, already filtered (e.g. from
+                  load_block_frames); df is then not searched and may be None
+        parameter_overrides: {reference: {parameter: value}} replacing Excel
+                  values for what-if runs, e.g. {'Q5': {'Max applied VDS': 20}};
+                  'LamB' replaces the package lambda from 'Table 18'
     
     Returns:
         Tuple of (component_dataframe, total_lambda, block_reliability)
         - component_dataframe: DataFrame with columns ['Reference', 'Class', 'Failure_rate', 'Reliability']
+          (number of components when return_df is False)
         - total_lambda: Total failure rate for the block (failures/hour)
         - block_reliability: Block reliability R = exp(-lambda_total * t)
     """
-    import pandas as pd
-    
-    # Filter for the specific block (exact match)
-    block_df = df[df['Sheet'] == sheet_name].copy()
+    # Filter for the specific block (exact match) unless it was pre-sliced
+    if block_df is None:
+        block_df = df[df['Sheet'] == sheet_name]
     
     if block_df.empty:
         if verbose:
             print(f"WARNING: No components found for sheet '{sheet_name}'")
-        return pd.DataFrame(), 0.0, 1.0
+        return (pd.DataFrame() if return_df else 0), 0.0, 1.0
     
     if verbose:
         print(f"\n{Colors.CYAN}Processing block: {sheet_name}{Colors.ENDC}")
         print(f"Components found: {len(block_df)}")
     
-    # Calculate lambda for each component
-    lambdas = []
-    errors = []
+    # Calculate lambda for each component, one vectorized pass per class
+    errors = _ErrorLog()
     
-    for idx, row in block_df.iterrows():
-        component_class = row.get('Class', '')
-        reference = row.get('Reference', 'Unknown')
-        lam = None
-        
-        # Skip if class is NaN or empty
-        if pd.isna(component_class) or component_class == '':
-            if verbose:
-                print(f"  WARNING: {reference} has no Class specified, skipping")
-            lam = 0.0
-            lambdas.append(lam)
-            continue
-        
-        try:
-            # Transistors
-            if component_class == 'Low Power transistor (8.4)':
-                transistor_type = row.get('Transistor type', '')
-                typ1 = "MOS" if 'MOS' in str(transistor_type) else "Bipolar"
-                
-                # Check for required temperature
-                if pd.isna(row.get('Temperature_Junction')):
-                    errors.append(f"{reference}: Missing Temperature_Junction")
-                    lam = 0.0
-                else:
-                    # Get package lambda value
-                    lb = l_b(row.get('Table 18'))
-                    
-                    # Get voltage parameters (can default to 0 if NaN)
-                    vce_max = 0 if pd.isna(row.get('Max repetitive VCE')) else row['Max repetitive VCE']
-                    vce_min = 1 if pd.isna(row.get('Min specified VCE')) else row['Min specified VCE']
-                    vds_max = 0 if pd.isna(row.get('Max applied VDS')) else row['Max applied VDS']
-                    vds_min = 1 if pd.isna(row.get('Min specified VDS')) else row['Min specified VDS']
-                    vgs_max = 0 if pd.isna(row.get('Max applied VGS')) else row['Max applied VGS']
-                    vgs_min = 1 if pd.isna(row.get('Min specified VGS')) else row['Min specified VGS']
-                    
-                    lam = lambda_transistors(
-                        ni, row['Temperature_Junction'], typ1, "low", dt,
-                        lb, pi_i, leos,
-                        vce_max, vce_min, vds_max, vds_min, vgs_max, vgs_min
-                    )
-            
-            elif component_class == 'Power Transistor (8.5)':
-                transistor_type = row.get('Transistor type', '')
-                typ1 = "MOS" if 'MOS' in str(transistor_type) else "Bipolar"
-                
-                # Check for required temperature
-                if pd.isna(row.get('Temperature_Junction')):
-                    errors.append(f"{reference}: Missing Temperature_Junction")
-                    lam = 0.0
-                else:
-                    # Get package lambda value
-                    lb = l_b(row.get('Table 18'))
-                    
-                    # Get voltage parameters (can default to 0 if NaN)
-                    vce_max = 0 if pd.isna(row.get('Max repetitive VCE')) else row['Max repetitive VCE']
-                    vce_min = 1 if pd.isna(row.get('Min specified VCE')) else row['Min specified VCE']
-                    vds_max = 0 if pd.isna(row.get('Max applied VDS')) else row['Max applied VDS']
-                    vds_min = 1 if pd.isna(row.get('Min specified VDS')) else row['Min specified VDS']
-                    vgs_max = 0 if pd.isna(row.get('Max applied VGS')) else row['Max applied VGS']
-                    vgs_min = 1 if pd.isna(row.get('Min specified VGS')) else row['Min specified VGS']
-                    
-                    lam = lambda_transistors(
-                        ni, row['Temperature_Junction'], typ1, "not low", dt,
-                        lb, pi_i, leos,
-                        vce_max, vce_min, vds_max, vds_min, vgs_max, vgs_min
-                    )
-            
-            # Capacitors
-            elif component_class == 'Ceramic Capacitor (10.3)':
-                if pd.isna(row.get('Temperature_Ambiant')):
-                    errors.append(f"{reference}: Missing Temperature_Ambiant")
-                    lam = 0.0
-                else:
-                    lam = lambda_capacitors(ni, row['Temperature_Ambiant'], dt, "dielectrique")
-            
-            elif component_class == 'Tantlum Capacitor (10.4)':
-                if pd.isna(row.get('Temperature_Ambiant')):
-                    errors.append(f"{reference}: Missing Temperature_Ambiant")
-                    lam = 0.0
-                else:
-                    lam = lambda_capacitors(ni, row['Temperature_Ambiant'], dt, "tantlum")
-            
-            # Resistors
-            elif component_class == 'Resistor (11.1)':
-                required = {
-                    'Temperature_Ambiant': row.get('Temperature_Ambiant'),
-                    'Operating_Power': row.get('Operating_Power'),
-                    'Rated_Power': row.get('Rated_Power')
-                }
-                missing = [name for name, val in required.items() if pd.isna(val)]
-                
-                if missing:
-                    errors.append(f"{reference}: Missing {', '.join(missing)}")
-                    lam = 0.0
-                else:
-                    lam = lambda_resistors(
-                        row['Temperature_Ambiant'],
-                        row['Operating_Power'],
-                        row['Rated_Power'],
-                        dt, ni
-                    )
-            
-            # Inductors
-            elif component_class == 'Inductor (12)':
-                required = {
-                    'Temperature_Ambiant': row.get('Temperature_Ambiant'),
-                    'Power loss': row.get('Power loss'),
-                    'Radiating surface': row.get('Radiating surface')
-                }
-                missing = [name for name, val in required.items() if pd.isna(val)]
-                
-                if missing:
-                    errors.append(f"{reference}: Missing {', '.join(missing)}")
-                    lam = 0.0
-                else:
-                    # Parse radiating surface
-                    surface_str = str(row['Radiating surface'])
-                    try:
-                        if 'x' in surface_str:
-                            parts = surface_str.split('x')
-                            # Surface is in mm x mm, convert to dm^2
-                            w = float(parts[0].strip())
-                            h = float(parts[1].strip())
-                            sur = (w / 100) * (h / 100)
-                        else:
-                            errors.append(f"{reference}: Invalid surface format '{surface_str}'")
-                            sur = 0.0132  # Fallback
-                    except:
-                        errors.append(f"{reference}: Could not parse surface '{surface_str}'")
-                        sur = 0.0132  # Fallback
-                    
-                    lam = lambda_inductors(
-                        "inductor",
-                        row.get("Inductor type", "Power Inductor"),
-                        ni, dt,
-                        row['Temperature_Ambiant'],
-                        row['Power loss'],
-                        sur
-                    )
-            
-            # Converters
-            elif component_class == 'Converter <10W (19.6)':
-                lam = lambda_converters("W<10", ni, dt)
-            
-            elif component_class == 'Converter >10W (19.6)':
-                lam = lambda_converters("W>10", ni, dt)
-            
-            # Diodes
-            elif component_class in ['Low power diode (8.2)', 'Power diodes (8.3)']:
-                required = {
-                    'diode_type': row.get('diode_type'),
-                    'Temperature_Junction': row.get('Temperature_Junction')
-                }
-                missing = [name for name, val in required.items() if pd.isna(val)]
-                
-                if missing:
-                    errors.append(f"{reference}: Missing {', '.join(missing)}")
-                    lam = 0.0
-                else:
-                    # Get package lambda value
-                    lb = l_b(row.get('Table 18'))
-                    
-                    lam = lambda_diode(
-                        row['diode_type'],
-                        row['Temperature_Junction'],
-                        ni, dt, lb,
-                        pi_i, leos,
-                        component_class
-                    )
-            
-            # Primary batteries
-            elif component_class == 'Primary batteries (19.1)':
-                lam = lambda_primary(component_class)
-            
-            # Integrated circuits
-            elif component_class == 'Integrated Circuit (7)':
-                # Check for required parameters
-                required_params = {
-                    'Construction Date': row.get('Construction Date'),
-                    'Temperature_Junction': row.get('Temperature_Junction'),
-                    'alpha_s': row.get('alpha_s'),
-                    'alpha_c': row.get('alpha_c'),
-                    'Table 16': row.get('Table 16'),
-                    'Table 17a': row.get('Table 17a')
-                }
-                
-                missing = [name for name, val in required_params.items() if pd.isna(val)]
-                
-                if missing:
-                    errors.append(f"{reference}: Missing required IC parameters: {', '.join(missing)}")
-                    lam = 0.0
-                else:
-                    # Only calculate if we have all required data
-                    lam = lambda_int(
-                        row['Construction Date'],
-                        row['Temperature_Junction'],
-                        row['alpha_s'],
-                        row['alpha_c'],
-                        ni, dt,
-                        row['Table 16'],
-                        row['Table 17a'],
-                        row.get('Lam3', 1.3)  # Lam3 is optional, has reasonable default
-                    )
-            
-            else:
-                if verbose:
-                    errors.append(f"Unknown class '{component_class}' for {reference}")
-                lam = 0.0
-        
-        except Exception as e:
-            if verbose:
-                errors.append(f"Error calculating lambda for {reference}: {type(e).__name__}: {e}")
-            lam = 0.0
-        
-        lambdas.append(lam if lam is not None else 0.0)
+    references = block_df['Reference'].to_numpy()
+    classes = block_df['Class']
+    no_class = (classes.isna() | (classes == '')).to_numpy()
+    
+    # Skip if class is NaN or empty
+    if verbose:
+        for reference in references[no_class]:
+            print(f"  WARNING: {reference} has no Class specified, skipping")
+    
+    overrides = None
+    if parameter_overrides:
+        overrides = _reference_overrides(block_df, references, parameter_overrides)
+    lambdas = _component_lambdas(block_df, references, errors, verbose, ni, dt, pi_i, leos, overrides)
     
     # Print errors if any
     if errors and verbose:
         print(f"\n{Colors.YELLOW}Data Quality Issues:{Colors.ENDC}")
-        for err in errors[:10]:  # Limit to first 10 errors
+        for err in errors.messages:  # Only the first MAX_PRINTED_ERRORS are kept
             print(f"  {err}")
-        if len(errors) > 10:
-            print(f"  ... and {len(errors) - 10} more")
+        if errors.count > errors.limit:
+            print(f"  ... and {errors.count - errors.limit} more")
         
         # Count components with zero lambda (missing data)
-        zero_count = sum(1 for lam in lambdas if lam == 0.0)
+        zero_count = int(np.count_nonzero(lambdas == 0.0))
         if zero_count > 0:
             print(f"\n{Colors.RED}WARNING: {zero_count}/{len(lambdas)} components have lambda=0 due to missing data{Colors.ENDC}")
             print(f"These components are being EXCLUDED from reliability calculation.")
             print(f"Fix missing parameters in your Excel file for accurate results.")
     
-    # Add lambda column
-    block_df = block_df.assign(Failure_rate=lambdas)
-    
-    # Calculate individual reliabilities
-    reliabilities = [mat.exp(-lam * t_mission) if lam > 0 else np.nan for lam in lambdas]
-    block_df = block_df.assign(Reliability=reliabilities)
-    
     # Calculate block totals (series assumption) - only include components with valid lambda
-    valid_lambdas = [lam for lam in lambdas if lam > 0]
-    lambda_total = sum(valid_lambdas)
+    valid = lambdas > 0
+    lambda_total = float(lambdas[valid].sum())
     R_block = mat.exp(-lambda_total * t_mission)
     
     if verbose:
-        valid_count = len(valid_lambdas)
+        valid_count = int(np.count_nonzero(valid))
         total_count = len(lambdas)
         print(f"\n{Colors.CYAN}Block Results:{Colors.ENDC}")
         print(f"Valid components: {valid_count}/{total_count}")
         print(f"Block lambda: {lambda_total:.6e} failures/hour")
         print(f"Block reliability: {R_block:.6f}")
     
+    if not return_df:
+        return len(block_df), lambda_total, R_block
+    
+    # Calculate individual reliabilities
+    reliabilities = np.where(valid, np.exp(-lambdas * t_mission), np.nan)
+    
     # Return simplified dataframe with Class column
-    result_df = block_df[['Reference', 'Class', 'Failure_rate', 'Reliability']].copy()
+    result_df = pd.DataFrame({
+        'Reference': references,
+        'Class': classes.to_numpy(),
+        'Failure_rate': lambdas,
+        'Reliability': reliabilities
+    }, index=block_df.index)
     
     return result_df, lambda_total, R_block
 
 
+@functools.lru_cache(maxsize=256)
+def _block_totals(path, mtime, sheet_name, ni, dt, t_mission, pi_i, leos):
+    """Block totals of one workbook version (cached on the file and parameters)"""
+    block_df = _group_components(path, mtime, frozenset(COMPONENT_COLUMNS)).get(sheet_name)
+    if block_df is None:
+        return 0, 0.0, 1.0
+    return calculate_block_reliability(None, sheet_name, ni, dt, t_mission, pi_i, leos,
+                                       verbose=False, return_df=False, block_df=block_df)
+
+
+def block_totals(excel_file, sheet_name, ni=NI, dt=DT, t_mission=T_MISSION, pi_i=PI_I, leos=LEOS):
+    """
+    Totals of one block of a workbook, memoized.
+    
+    Repeated calls for the same file version, block and parameters (menu
+    reruns, parameter sweeps over a few values) return the stored result.
+    Modifying the file on disk invalidates it, as for load_components.
+    
+    Args:
+        excel_file: Path to the Excel file
+        sheet_name: Name of the sheet/block to analyze
+        ni: Number of cycles per year
+        dt: Temperature cycle amplitude (°C)
+        t_mission: Mission time (hours)
+        pi_i: Overstress factor
+        leos: Electrical overstress baseline
+    
+    Returns:
+        Tuple of (component_count, total_lambda, block_reliability)
+    """
+    path = os.path.abspath(excel_file)
+    return _block_totals(path, os.path.getmtime(path), sheet_name, ni, dt, t_mission, pi_i, leos)
+
+
+# Groups covering at least this many components are evaluated in worker
+# processes; below it, starting the pool costs more than it saves
+GROUP_PARALLEL_MIN_COMPONENTS = 5000
+
+
+def _group_block_worker(block_df, sheet, ni, dt, t_mission, pi_i, leos, verbose):
+    """Totals of one block of a group, with its printed output captured
+    
+    Defined at module level so it can run in a worker process; the caller
+    prints the captured text in block order.
+    """
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        _, lam, R = calculate_block_reliability(None, sheet, ni, dt, t_mission, pi_i, leos,
+                                                verbose, return_df=False, block_df=block_df)
+    return lam, R, out.getvalue()
+
+
 def calculate_group_reliability(df, sheet_list, ni=NI, dt=DT, t_mission=T_MISSION,
                                 pi_i=PI_I, leos=LEOS, verbose=True):
     """
@@ -942,11 +1635,26 @@ def calculate_group_reliability(df, sheet_list, ni=NI, dt=DT, t_mission=T_MISSIO
         print(f"Processing group of {len(sheet_list)} blocks")
         print(f"{'='*60}")
     
-    for sheet in sheet_list:
-        _, lam, R = calculate_block_reliability(df, sheet, ni, dt, t_mission, 
-                                               pi_i, leos, verbose)
-        R_list.append(R)
-        lambda_list.append(lam)
+    # Partition the components by sheet once instead of masking df per block
+    blocks = dict(tuple(df.groupby('Sheet', sort=False, observed=True)))
+    block_frames = [blocks.get(sheet, df.iloc[:0]) for sheet in sheet_list]
+    
+    if len(block_frames) > 1 and sum(map(len, block_frames)) >= GROUP_PARALLEL_MIN_COMPONENTS:
+        # Blocks are independent: each worker only receives its own rows
+        worker = functools.partial(_group_block_worker, ni=ni, dt=dt, t_mission=t_mission,
+                                   pi_i=pi_i, leos=leos, verbose=verbose)
+        with ProcessPoolExecutor() as executor:
+            for lam, R, output in executor.map(worker, block_frames, sheet_list):
+                sys.stdout.write(output)
+                R_list.append(R)
+                lambda_list.append(lam)
+    else:
+        for sheet, block_df in zip(sheet_list, block_frames):
+            _, lam, R = calculate_block_reliability(df, sheet, ni, dt, t_mission, 
+                                                   pi_i, leos, verbose, return_df=False,
+                                                   block_df=block_df)
+            R_list.append(R)
+            lambda_list.append(lam)
     
     # Series combination
     R_group = series_reliability(R_list)
@@ -48,6 +48,8 @@ données si dessus. Estimer ces différents paramètres et calculer les taux de
 
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -71,10 +73,357 @@ def print_info(text: str):
     print(f"{Colors.BLUE}ℹ {text}{Colors.ENDC}")
 
 
+# ============================================================================
+# RANDOM PARAMETER TABLES (see the specification at the top of the file)
+# ============================================================================
+
+def _by_reference(groups) -> Dict[str, tuple]:
+    """Flatten [(references, value), ...] into {reference: value}"""
+    return {ref: value for refs, value in groups for ref in refs}
+
+
+# Uniform (low, high) ranges per component reference
+LAMB_RANGES = _by_reference([
+    (("Q5", "Q6", "D3", "D12", "D2"), (5.7, 6.9)),
+    (("D10", "D8"), (1, 6.9)),
+    (("Q10", "Q14", "Q17", "Q19", "Q20", "Q22", "Q12", "Q13", "Q16", "Q23", "Q26", "Q32",
+      "Q34", "Q36"), (1, 6.9)),
+    (("Q9", "Q1", "Q11", "Q15", "Q18", "Q2", "Q21", "Q28", "Q3", "Q4", "Q8", "D4", "D5",
+      "D6", "D7"), (1, 6.9)),
+    (("Q24", "Q25", "Q27", "Q33", "Q35", "Q37", "Q7"), (5.7, 6.9)),
+])
+
+LAM3_RANGES = _by_reference([
+    (("U17", "U19"), (0.315, 0.627)),
+    (("U11", "U21", "U3", "U7"), (0.202, 0.371)),
+    (("U42",), (0.084, 0.118)),
+    (("U12", "U4", "U8"), (1.3, 4.1)),
+    (("U35",), (1.3, 2.94)),
+])
+
+VDS_RANGES = _by_reference([
+    (("Q5", "Q6"), (17, 23)),
+])
+
+VCE_RANGES = _by_reference([
+    (("Q10", "Q14", "Q17", "Q19", "Q20", "Q22"), (10, 15)),
+    (("Q12", "Q13", "Q16", "Q23", "Q26", "Q32", "Q34", "Q36", "Q9"), (3, 3.6)),
+])
+
+POWER_RANGES = _by_reference([
+    (("U42", "U23", "U32", "U41", "U33", "U34", "U43"), (3, 5)),
+    (("L1", "L2", "L3", "L4", "L5"), (5, 15)),
+])
+
+# Ranges for every other component that has a value for the parameter
+VDS_DEFAULT_RANGE = (1.5, 2.5)
+POWER_DEFAULT_RANGE = (0.5, 1.5)
+
+# 50% / 50% choices (first, second) per component reference
+LAM3_CHOICES = _by_reference([
+    (("U22",), (6.479, 1.3)),
+    (("U10", "U2", "U6"), (4.1, 1.3)),
+    (("U23", "U32", "U14", "U20", "U25", "U27", "U29", "U31", "U36", "U39", "U40", "U41"),
+     (1.164, 0.2808)),
+])
+
+
+# ============================================================================
+# SAMPLING
+#
+# Every generator draws the whole (n_samples, n_components) matrix with one
+# vectorized call: the per-component bounds are gathered into arrays first,
+# and components without a distribution get low == high == nominal value.
+# ============================================================================
+
+# Shared random generator (PCG64), seeded so runs are reproducible
+RNG = np.random.default_rng(seed=0)
+
+# Sampled parameters only need a few significant digits: single precision
+# halves the size of the (n_samples, n_components) matrices. Failure rates
+# and reliabilities are still computed in float64.
+SAMPLE_DTYPE = np.float32
+
+def _bounds(references, table: Dict[str, tuple], nominal: np.ndarray,
+            default: tuple = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-component (first, second) bound arrays aligned to references
+
+    Components missing from table use default if they have a nominal value,
+    otherwise both bounds are the nominal value (no variation).
+    """
+    nominal = np.asarray(nominal, dtype=np.float64)
+    fallback = [
+        default if default is not None and not np.isnan(value) else (value, value)
+        for value in nominal
+    ]
+    bounds = np.array([table.get(ref, fb) for ref, fb in zip(references, fallback)],
+                      dtype=np.float64).reshape(len(nominal), 2)
+    return bounds[:, 0], bounds[:, 1]
+
+
+def generate_uniform_samples(references, table: Dict[str, tuple], n_samples: int,
+                             nominal: np.ndarray, default: tuple = None,
+                             rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Uniform samples of one parameter for a set of components.
+
+    Args:
+        references: Component references (one column per reference)
+        table: {reference: (low, high)} ranges
+        n_samples: Number of Monte Carlo iterations (rows)
+        nominal: Nominal value per component, used when it has no range
+        default: Range for components with a nominal value but no entry
+        rng: Random generator (defaults to the module RNG)
+
+    Returns:
+        Array of shape (n_samples, len(references)), of type SAMPLE_DTYPE
+    """
+    low, high = (bound.astype(SAMPLE_DTYPE) for bound in _bounds(references, table, nominal, default))
+    rng = RNG if rng is None else rng
+    # low + (high - low) * U[0, 1): same draw as rng.uniform, but a missing
+    # nominal value (NaN) propagates instead of raising
+    samples = rng.random((n_samples, len(low)), dtype=SAMPLE_DTYPE)
+    samples *= high - low
+    samples += low
+    return samples
+
+
+def generate_choice_samples(references, table: Dict[str, tuple], n_samples: int,
+                            nominal: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+    """
+    50% / 50% samples between two values of one parameter.
+
+    Args:
+        references: Component references (one column per reference)
+        table: {reference: (first, second)} values
+        n_samples: Number of Monte Carlo iterations (rows)
+        nominal: Nominal value per component, used when it has no entry
+        rng: Random generator (defaults to the module RNG)
+
+    Returns:
+        Array of shape (n_samples, len(references)), of type SAMPLE_DTYPE
+    """
+    rng = RNG if rng is None else rng
+    first, second = (value.astype(SAMPLE_DTYPE) for value in _bounds(references, table, nominal))
+    return np.where(rng.random((n_samples, len(first)), dtype=SAMPLE_DTYPE) < 0.5, first, second)
+
+
+def sample_parameters(block_df: pd.DataFrame, n_iterations: int,
+                      rng: np.random.Generator = None) -> Dict[str, np.ndarray]:
+    """
+    Draw every random parameter of a block for all iterations at once.
+
+    Args:
+        block_df: Rows of one block
+        n_iterations: Number of Monte Carlo iterations
+        rng: Random generator (defaults to the module RNG)
+
+    Returns:
+        {parameter: array (n_iterations, n_components)}, usable as the
+        overrides of rm.sample_block_lambdas
+    """
+    references = block_df['Reference'].to_numpy()
+    nominal = rm.nominal_parameters(block_df)
+
+    # Lam3 is either a uniform range or a two-point choice depending on the component
+    lam3 = generate_uniform_samples(references, LAM3_RANGES, n_iterations, nominal['Lam3'], rng=rng)
+    is_choice = np.array([ref in LAM3_CHOICES for ref in references], dtype=bool)
+    if is_choice.any():
+        lam3[:, is_choice] = generate_choice_samples(
+            references[is_choice], LAM3_CHOICES, n_iterations, nominal['Lam3'][is_choice], rng=rng
+        )
+
+    return {
+        'LamB': generate_uniform_samples(references, LAMB_RANGES, n_iterations, nominal['LamB'], rng=rng),
+        'Lam3': lam3,
+        'Max applied VDS': generate_uniform_samples(references, VDS_RANGES, n_iterations,
+                                                    nominal['Max applied VDS'], VDS_DEFAULT_RANGE, rng=rng),
+        'Max repetitive VCE': generate_uniform_samples(references, VCE_RANGES, n_iterations,
+                                                       nominal['Max repetitive VCE'], rng=rng),
+        'Operating_Power': generate_uniform_samples(references, POWER_RANGES, n_iterations,
+                                                    nominal['Operating_Power'], POWER_DEFAULT_RANGE, rng=rng),
+    }
+
+
+# ============================================================================
+# COMPONENT FAILURE RATES
+# ============================================================================
+
+def monte_carlo_component_lambda(block_df: pd.DataFrame, reference: str, n_iterations: int,
+                                 rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Monte Carlo samples of the failure rate of one component.
+
+    The parameters of the whole block are drawn together and evaluated with
+    one batched call per component class, so the result is consistent with
+    a block-level run using the same generator state.
+
+    Args:
+        block_df: Rows of the block containing the component
+        reference: Component reference (e.g. 'Q5')
+        n_iterations: Number of Monte Carlo iterations
+        rng: Random generator (defaults to the module RNG)
+
+    Returns:
+        Array (n_iterations,) of failure rates (failures/hour)
+    """
+    matches = np.flatnonzero(block_df['Reference'].to_numpy() == reference)
+    if len(matches) == 0:
+        raise ValueError(f"Component '{reference}' not found in block")
+    lambdas = rm.sample_block_lambdas(block_df, sample_parameters(block_df, n_iterations, rng))
+    return lambdas[:, matches[0]]
+
+
+# ============================================================================
+# BLOCK RELIABILITY
+# ============================================================================
+
+# Runs with at least this many component samples (iterations x components)
+# are split into chunks evaluated in worker processes
+MC_PARALLEL_MIN_SAMPLES = 5_000_000
+
+# Largest lambda matrix (iterations x components) evaluated in one chunk,
+# which bounds the memory used by a run
+MC_CHUNK_SAMPLES = 2_000_000
+
+
+def _chunk_moments(block_df: pd.DataFrame, n_iterations: int,
+                   rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Block lambda samples of one chunk with the per-component lambda mean and M2 (sum of squared deviations)"""
+    lambdas = rm.sample_block_lambdas(block_df, sample_parameters(block_df, n_iterations, rng))
+    mean = lambdas.mean(axis=0)
+    return lambdas.sum(axis=1), mean, ((lambdas - mean) ** 2).sum(axis=0)
+
+
+# Block rows of the worker process, sent once by the pool initializer
+_worker_block_df = None
+
+def _init_chunk_worker(block_df: pd.DataFrame):
+    global _worker_block_df
+    _worker_block_df = block_df
+
+
+def _chunk_worker(n_iterations: int, rng: np.random.Generator):
+    return _chunk_moments(_worker_block_df, n_iterations, rng)
+
+
+def monte_carlo_block_reliability(block_df: pd.DataFrame, n_iterations: int,
+                                  t_mission: float = rm.T_MISSION,
+                                  rng: np.random.Generator = None) -> Dict[str, object]:
+    """
+    Monte Carlo estimate of the reliability of one block (series system).
+
+    All iterations are evaluated together: the (n_iterations, n_components)
+    failure-rate matrix is summed along the components to get one block
+    lambda per iteration. Large runs are split into chunks of at most
+    MC_CHUNK_SAMPLES component samples, each drawn from its own child
+    generator, and evaluated in worker processes above MC_PARALLEL_MIN_SAMPLES.
+
+    Args:
+        block_df: Rows of one block
+        n_iterations: Number of Monte Carlo iterations
+        t_mission: Mission time (hours)
+        rng: Random generator (defaults to the module RNG)
+
+    Returns:
+        Dict with the per-iteration 'lambda_samples' and 'R_samples' arrays,
+        their 'lambda_mean', 'R_mean', 'R_std' and the 95% interval 'R_ci',
+        and the per-component 'component_lambda_mean' / 'component_lambda_std'
+    """
+    rng = RNG if rng is None else rng
+    n_samples = n_iterations * max(len(block_df), 1)
+    n_chunks = min(-(-n_samples // MC_CHUNK_SAMPLES), n_iterations)
+
+    if n_chunks <= 1:
+        chunks = [_chunk_moments(block_df, n_iterations, rng)]
+    else:
+        # Independent streams per chunk, so results do not depend on scheduling
+        sizes = [len(part) for part in np.array_split(np.arange(n_iterations), n_chunks)]
+        streams = rng.spawn(n_chunks)
+        if n_samples >= MC_PARALLEL_MIN_SAMPLES and (os.cpu_count() or 1) > 1:
+            with ProcessPoolExecutor(initializer=_init_chunk_worker, initargs=(block_df,)) as executor:
+                chunks = list(executor.map(_chunk_worker, sizes, streams))
+        else:
+            chunks = [_chunk_moments(block_df, size, stream) for size, stream in zip(sizes, streams)]
+
+    # Merge the per-chunk component moments (Chan et al. pairwise update)
+    lambda_total, mean, m2 = chunks[0]
+    count = len(lambda_total)
+    for chunk_total, chunk_mean, chunk_m2 in chunks[1:]:
+        chunk_count = len(chunk_total)
+        delta = chunk_mean - mean
+        total = count + chunk_count
+        mean = mean + delta * (chunk_count / total)
+        m2 = m2 + chunk_m2 + delta ** 2 * (count * chunk_count / total)
+        count = total
+    lambda_total = np.concatenate([chunk[0] for chunk in chunks])
+    R_samples = np.exp(-lambda_total * t_mission)
+
+    return {
+        'component_lambda_mean': mean,
+        'component_lambda_std': np.sqrt(m2 / count),
+        'lambda_samples': lambda_total,
+        'R_samples': R_samples,
+        'lambda_mean': float(lambda_total.mean()),
+        'R_mean': float(R_samples.mean()),
+        'R_std': float(R_samples.std()),
+        'R_ci': tuple(float(q) for q in np.percentile(R_samples, [2.5, 97.5])),
+    }
+
+
+# ============================================================================
+# RESULTS
+# ============================================================================
+
+def print_monte_carlo_results(block_df: pd.DataFrame, results: Dict[str, object],
+                              lambda_nominal: float, R_nominal: float):
+    """Print the reliability statistics and the components with random failure rates"""
+    low, high = results['R_ci']
+    print(f"\n{Colors.CYAN}Monte Carlo Results ({len(results['R_samples'])} iterations):{Colors.ENDC}")
+    print(f"Nominal lambda: {lambda_nominal:.6e} failures/hour")
+    print(f"Mean lambda:    {results['lambda_mean']:.6e} failures/hour")
+    print(f"Nominal reliability: {R_nominal:.6f}")
+    print(f"Mean reliability:    {results['R_mean']:.6f} (std {results['R_std']:.6f})")
+    print(f"95% interval:        [{low:.6f}, {high:.6f}]")
+
+    # Components whose failure rate actually varies, largest spread first
+    # (constant ones only show rounding noise in their std)
+    mean = results['component_lambda_mean']
+    std = results['component_lambda_std']
+    order = np.argsort(-std)
+    order = order[std[order] > 1e-9 * mean[order]]
+    if len(order) == 0:
+        return
+    references = block_df['Reference'].to_numpy()
+    classes = block_df['Class'].to_numpy()
+    print(f"\n{Colors.BOLD}{'Reference':<15} {'Class':<35} {'Mean lambda':>15} {'Std':>12}{Colors.ENDC}")
+    for i in order:
+        print(f"{references[i]:<15} {str(classes[i]):<35} {mean[i]:>15.6e} {std[i]:>12.3e}")
+
+
+def plot_reliability_distribution(results: Dict[str, object], R_nominal: float, sheet_name: str):
+    """Histogram of the block reliability samples with the nominal value and 95% interval"""
+    fig, ax = plt.subplots(figsize=(9, 5))
+    ax.hist(results['R_samples'], bins=50, color='tab:blue', alpha=0.7)
+    ax.axvline(R_nominal, color='tab:red', label=f"Nominal R = {R_nominal:.6f}")
+    ax.axvline(results['R_mean'], color='black', linestyle='--', label=f"Mean R = {results['R_mean']:.6f}")
+    for bound in results['R_ci']:
+        ax.axvline(bound, color='gray', linestyle=':')
+    ax.set_xlabel("Block reliability")
+    ax.set_ylabel("Iterations")
+    ax.set_title(f"Monte Carlo reliability - {sheet_name}")
+    ax.legend()
+    fig.tight_layout()
+    plt.show()
+
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 
+# Number of Monte Carlo iterations per block
+N_ITERATIONS = 10000
+
 def run_monte_carlo_analysis(excel_file: str, sheet_name: str):
     """
     Complete Monte Carlo analysis workflow.
@@ -83,15 +432,26 @@ def run_monte_carlo_analysis(excel_file: str, sheet_name: str):
 
     # Load Excel file
     print_info(f"Loading data from {excel_file}...")
-    df = pd.read_excel(excel_file)
+    df = rm.load_components(excel_file)
 
     if 'Sheet' not in df.columns:
         raise ValueError("Excel file must have a 'Sheet' column")
 
-    # TODO: Implement the complete analysis workflow
-    
-    # c.f. run_block_reliability() in main.py if you want inspiration for the
-    # automation
+    block_df = rm.load_block_frames(excel_file).get(sheet_name)
+    if block_df is None:
+        raise ValueError(f"No components found for sheet '{sheet_name}'")
+
+    # Deterministic baseline with the nominal parameters
+    _, lambda_nominal, R_nominal = rm.calculate_block_reliability(
+        None, sheet_name, verbose=False, return_df=False, block_df=block_df
+    )
+
+    # All iterations at once: one (N_ITERATIONS, n_components) lambda matrix
+    print_info(f"Running {N_ITERATIONS} iterations on {len(block_df)} components...")
+    results = monte_carlo_block_reliability(block_df, N_ITERATIONS, rm.T_MISSION, RNG)
+
+    print_monte_carlo_results(block_df, results, lambda_nominal, R_nominal)
+    plot_reliability_distribution(results, R_nominal, sheet_name)
 
     print("\nAnalysis complete")
 
@@ -15,11 +15,13 @@ vérifier vos codes. Rappel : la mission dure 5 ans, on pourra prendre t=43800.
 Pour des raisons de simplicité, calculer les indices de Sobol par bloc, pas sur le système entier.
 """
 
+from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from typing import Dict, List, Tuple
 import reliability_math as rm
+import task1_monte_carlo as mc
 
 class Colors:
     HEADER = '\033[95m'
@@ -38,6 +40,452 @@ def print_info(text: str):
     print(f"{Colors.BLUE}ℹ {text}{Colors.ENDC}")
 
 
+# ============================================================================
+# SOBOL INDICES
+#
+# The factors are the component failure rates, each following the
+# distribution induced by the random parameters of task 1. The block
+# reliability is R = exp(-t * sum(lambda_k)), so the hybrid samples AB_i
+# (A with column i taken from B) never need to be built: their block lambda
+# is sum(A) - A[:, i] + B[:, i], for every i at once.
+# ============================================================================
+
+def sobol_indices(df: pd.DataFrame, sheet_name: str, n_samples: int = 4096,
+                  t_mission: float = rm.T_MISSION,
+                  rng: np.random.Generator = None) -> pd.DataFrame:
+    """
+    First-order and total Sobol indices of the block reliability.
+
+    Pick-and-freeze estimation on two independent sample matrices A and B:
+    Saltelli (2010) estimator for S1, on centered outputs since R varies
+    little around a mean close to 1, and Jansen estimator for ST. Uses
+    n_samples * (n_components + 2) model evaluations in one vectorized pass.
+
+    Args:
+        df: DataFrame containing component data
+        sheet_name: Name of the sheet/block to analyze
+        n_samples: Number of rows of A and B
+        t_mission: Mission time (hours)
+        rng: Random generator (defaults to the task 1 RNG)
+
+    Returns:
+        DataFrame with columns ['Reference', 'Class', 'S1', 'ST'], sorted by
+        decreasing total index
+    """
+    block_df = df[df['Sheet'] == sheet_name]
+    if block_df.empty:
+        raise ValueError(f"No components found for sheet '{sheet_name}'")
+
+    A = rm.sample_block_lambdas(block_df, mc.sample_parameters(block_df, n_samples, rng))
+    B = rm.sample_block_lambdas(block_df, mc.sample_parameters(block_df, n_samples, rng))
+
+    lambda_A = A.sum(axis=1)
+    f_A = np.exp(-lambda_A * t_mission)
+    f_B = np.exp(-B.sum(axis=1) * t_mission)
+    f_AB = np.exp(-(lambda_A[:, None] - A + B) * t_mission)  # column i: f(AB_i)
+
+    f_all = np.concatenate([f_A, f_B])
+    variance = f_all.var()
+    if variance > 0:
+        S1 = ((f_B - f_all.mean())[:, None] * (f_AB - f_A[:, None])).mean(axis=0) / variance
+        ST = 0.5 * ((f_A[:, None] - f_AB) ** 2).mean(axis=0) / variance
+        # Components without random parameters have exactly zero indices;
+        # only estimator noise would remain otherwise
+        varies = (A != B).any(axis=0)
+        S1 = np.where(varies, S1, 0.0)
+        ST = np.where(varies, ST, 0.0)
+    else:
+        S1 = ST = np.zeros(A.shape[1])
+
+    result = pd.DataFrame({
+        'Reference': block_df['Reference'].to_numpy(),
+        'Class': block_df['Class'].to_numpy(),
+        'S1': S1,
+        'ST': ST,
+    })
+    return result.sort_values('ST', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def print_sobol_indices(indices: pd.DataFrame, threshold: float = 1e-3):
+    """Print the components with a total index above threshold"""
+    shown = indices[indices['ST'] > threshold]
+    print(f"\n{Colors.CYAN}Sobol indices (components with ST > {threshold:g}):{Colors.ENDC}")
+    print(f"{Colors.BOLD}{'Reference':<15} {'Class':<35} {'S1':>10} {'ST':>10}{Colors.ENDC}")
+    for ref, cls, s1, st in shown[['Reference', 'Class', 'S1', 'ST']].itertuples(index=False, name=None):
+        print(f"{ref:<15} {str(cls):<35} {s1:>10.4f} {st:>10.4f}")
+    print(f"Sum of S1: {indices['S1'].sum():.4f} (close to 1 when the lambdas act additively)")
+
+
+# ============================================================================
+# LOCAL SENSITIVITIES
+#
+# Each component failure rate only depends on that component's parameters,
+# so moving one parameter of every component at once still isolates each
+# partial derivative. A central difference per parameter then covers the
+# whole block: 2 * len(parameters) evaluations in a single batched call,
+# whatever the number of components.
+# ============================================================================
+
+# Parameters whose local effect on the block reliability is reported
+SENSITIVITY_PARAMETERS = rm.SAMPLED_PARAMETERS + ('Temperature_Junction', 'Temperature_Ambiant')
+
+def _scaled_slopes(block_df: pd.DataFrame, parameters: Tuple[str, ...], relative_step: float,
+                   nominal: Dict[str, np.ndarray]) -> np.ndarray:
+    """p * dlambda_k/dp for every (parameter, component), from one batched central difference"""
+    n_params, n_components = len(parameters), len(block_df)
+
+    # Rows 2j and 2j+1 move parameter j up and down, everything else nominal
+    overrides = {}
+    for j, name in enumerate(parameters):
+        values = np.tile(nominal[name], (2 * n_params, 1))
+        values[2 * j] *= 1 + relative_step
+        values[2 * j + 1] *= 1 - relative_step
+        overrides[name] = values
+    lambdas = rm.sample_block_lambdas(block_df, overrides).reshape(n_params, 2, n_components)
+
+    # Not divided by p, since some nominal values are 0
+    return (lambdas[:, 0] - lambdas[:, 1]) / (2 * relative_step)
+
+
+def parameter_sensitivities(df: pd.DataFrame, sheet_name: str,
+                            parameters: Tuple[str, ...] = SENSITIVITY_PARAMETERS,
+                            relative_step: float = 1e-4,
+                            t_mission: float = rm.T_MISSION) -> pd.DataFrame:
+    """
+    Elasticity of the block reliability to every component parameter.
+
+    With R = exp(-t * sum(lambda_k)), the elasticity of R to a parameter p
+    of component k is (dR/dp) * p / R = -t * p * dlambda_k/dp, obtained
+    from central differences of lambda_k at p * (1 +/- relative_step).
+
+    Args:
+        df: DataFrame containing component data
+        sheet_name: Name of the sheet/block to analyze
+        parameters: Parameter names ('LamB' or numeric columns)
+        relative_step: Relative perturbation of each parameter
+        t_mission: Mission time (hours)
+
+    Returns:
+        DataFrame with columns ['Reference', 'Parameter', 'Value',
+        'dLambda_dp', 'Elasticity'] for every parameter that changes a
+        failure rate, sorted by decreasing absolute elasticity
+    """
+    block_df = df[df['Sheet'] == sheet_name]
+    if block_df.empty:
+        raise ValueError(f"No components found for sheet '{sheet_name}'")
+
+    nominal = rm.nominal_parameters(block_df, parameters)
+    n_params, n_components = len(parameters), len(block_df)
+    scaled_slope = _scaled_slopes(block_df, parameters, relative_step, nominal)
+    values = np.stack([nominal[name] for name in parameters])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = np.where(values != 0, scaled_slope / values, 0.0)
+
+    result = pd.DataFrame({
+        'Reference': np.tile(block_df['Reference'].to_numpy(), n_params),
+        'Parameter': np.repeat(parameters, n_components),
+        'Value': values.ravel(),
+        'dLambda_dp': slope.ravel(),
+        'Elasticity': -t_mission * scaled_slope.ravel(),
+    })
+    result = result[np.isfinite(result['Value']) & (result['Elasticity'] != 0)]
+    order = np.argsort(-result['Elasticity'].abs().to_numpy(), kind='stable')
+    return result.iloc[order].reset_index(drop=True)
+
+
+def print_parameter_sensitivities(sensitivities: pd.DataFrame, top: int = 10):
+    """Print the parameters with the largest absolute elasticities"""
+    print(f"\n{Colors.CYAN}Most influential parameters (elasticity of R):{Colors.ENDC}")
+    print(f"{Colors.BOLD}{'Reference':<15} {'Parameter':<22} {'Value':>12} {'Elasticity':>12}{Colors.ENDC}")
+    for ref, name, value, elasticity in sensitivities[['Reference', 'Parameter', 'Value', 'Elasticity']] \
+            .head(top).itertuples(index=False, name=None):
+        print(f"{ref:<15} {name:<22} {value:>12.4g} {elasticity:>12.3e}")
+
+
+def compute_sensitivity_matrix(df: pd.DataFrame, sheet_names: List[str],
+                               parameters: Tuple[str, ...] = SENSITIVITY_PARAMETERS,
+                               relative_step: float = 1e-4,
+                               t_mission: float = rm.T_MISSION) -> Tuple[np.ndarray, List[str], List[str]]:
+    """
+    Block-level elasticity of R to each parameter, for several blocks.
+
+    Entry [b, j] is the elasticity of the reliability of block b when
+    parameter j of all its components moves together, i.e. the sum of the
+    component elasticities of parameter_sensitivities.
+
+    Args:
+        df: DataFrame containing component data
+        sheet_names: Blocks (rows of the matrix)
+        parameters: Parameter names (columns of the matrix)
+        relative_step: Relative perturbation of each parameter
+        t_mission: Mission time (hours)
+
+    Returns:
+        Tuple of (matrix, row_labels, col_labels), matrix of shape
+        (len(sheet_names), len(parameters)) in float32; blocks without
+        components get a row of zeros
+    """
+    matrix = np.zeros((len(sheet_names), len(parameters)), dtype=np.float32)
+    blocks = dict(tuple(df.groupby('Sheet', sort=False, observed=True)))
+    for b, sheet in enumerate(sheet_names):
+        block_df = blocks.get(sheet)
+        if block_df is None or block_df.empty:
+            continue
+        nominal = rm.nominal_parameters(block_df, parameters)
+        scaled_slope = _scaled_slopes(block_df, parameters, relative_step, nominal)
+        matrix[b] = -t_mission * scaled_slope.sum(axis=1)
+    return matrix, list(sheet_names), list(parameters)
+
+
+# ============================================================================
+# PLOTS
+# ============================================================================
+
+def plot_tornado_diagram(sensitivities: pd.DataFrame, sheet_name: str, top: int = 15):
+    """Horizontal bars of the largest component elasticities, drawn with one barh call"""
+    shown = sensitivities.head(top)  # already sorted by absolute elasticity
+    elasticity = shown['Elasticity'].to_numpy()
+    labels = (shown['Reference'].astype(str) + ' - ' + shown['Parameter'].astype(str)).to_numpy()
+
+    fig, ax = plt.subplots(figsize=(9, max(3, 0.35 * len(shown) + 1)))
+    ax.barh(np.arange(len(shown)), elasticity,
+            color=np.where(elasticity < 0, 'tab:red', 'tab:green'))
+    ax.set_yticks(np.arange(len(shown)))
+    ax.set_yticklabels(labels)
+    ax.invert_yaxis()  # largest effect on top
+    ax.axvline(0, color='black', linewidth=0.8)
+    ax.set_xlabel("Elasticity of R ((dR/dp) * p / R)")
+    ax.set_title(f"Parameter sensitivities - {sheet_name}")
+    fig.tight_layout()
+    plt.show()
+
+
+def plot_sensitivity_heatmap(df: pd.DataFrame, sheet_names: List[str],
+                             parameters: Tuple[str, ...] = SENSITIVITY_PARAMETERS):
+    """Blocks x parameters elasticity matrix, drawn with one imshow call"""
+    matrix, rows, cols = compute_sensitivity_matrix(df, sheet_names, parameters)
+    limit = float(np.abs(matrix).max()) or 1.0
+
+    fig, ax = plt.subplots(figsize=(1.4 * len(cols) + 4, 0.4 * len(rows) + 2))
+    image = ax.imshow(matrix, aspect='auto', cmap='RdBu_r', vmin=-limit, vmax=limit)
+    ax.set_xticks(np.arange(len(cols)))
+    ax.set_xticklabels(cols, rotation=30, ha='right')
+    ax.set_yticks(np.arange(len(rows)))
+    ax.set_yticklabels(rows)
+    fig.colorbar(image, ax=ax, label="Elasticity of R")
+    ax.set_title("Block sensitivity to each parameter")
+    fig.tight_layout()
+    plt.show()
+
+
+# ============================================================================
+# MONTE CARLO ONE-AT-A-TIME SENSITIVITIES
+#
+# The parameters are sampled once and every perturbation reuses the same
+# samples (common random numbers), which keeps the Monte Carlo noise out of
+# the differences. As for the local sensitivities, scaling one parameter of
+# all components at once still isolates each component, so every
+# (parameter, sign, component) perturbation comes out of one batched call.
+# ============================================================================
+
+@dataclass
+class _MCWorkspace:
+    """Baseline Monte Carlo samples of a block and the buffers reused by every perturbation"""
+    block_df: pd.DataFrame
+    samples: Dict[str, np.ndarray]  # (n_iterations, n_components) per parameter
+    lambdas: np.ndarray             # (n_iterations, n_components)
+    lambda_total: np.ndarray        # (n_iterations,)
+    R_out: np.ndarray               # (n_iterations,)
+
+    @classmethod
+    def sample(cls, block_df: pd.DataFrame, n_iterations: int,
+               rng: np.random.Generator = None) -> '_MCWorkspace':
+        samples = mc.sample_parameters(block_df, n_iterations, rng)
+        lambdas = rm.sample_block_lambdas(block_df, samples)
+        return cls(block_df, samples, lambdas, lambdas.sum(axis=1), np.empty(n_iterations))
+
+    def mean_reliability(self, t_mission: float) -> float:
+        """Mean block reliability of the baseline samples"""
+        np.multiply(self.lambda_total, -t_mission, out=self.R_out)
+        return float(np.exp(self.R_out, out=self.R_out).mean())
+
+    def perturbed_reliabilities(self, factors: np.ndarray, t_mission: float) -> np.ndarray:
+        """
+        Mean block reliability with one sampled parameter of one component scaled.
+
+        Returns:
+            Array (n_parameters, len(factors), n_components): entry [j, s, k]
+            has parameter j of component k scaled by factors[s]
+        """
+        names = list(self.samples)
+        n_iterations, n_components = self.lambdas.shape
+        n_rows = len(names) * len(factors)
+
+        # Perturbed sample tensor: block (j, s) scales parameter j by factors[s]
+        overrides = {}
+        for j, name in enumerate(names):
+            values = np.broadcast_to(self.samples[name], (len(names), len(factors)) + self.lambdas.shape).copy()
+            values[j] *= np.asarray(factors, dtype=values.dtype)[:, None, None]
+            overrides[name] = values.reshape(n_rows * n_iterations, n_components)
+        perturbed = rm.sample_block_lambdas(self.block_df, overrides)
+        perturbed = perturbed.reshape(n_rows, n_iterations, n_components)
+
+        # Block lambda with only column k replaced, for every k at once
+        perturbed -= self.lambdas
+        perturbed += self.lambda_total[:, None]
+        perturbed *= -t_mission
+        R = np.exp(perturbed, out=perturbed).mean(axis=1)
+        return R.reshape(len(names), len(factors), n_components)
+
+
+def mc_parameter_sensitivities(df: pd.DataFrame, sheet_name: str, variation_percent: float = 10,
+                               n_iterations: int = 2000, t_mission: float = rm.T_MISSION,
+                               rng: np.random.Generator = None) -> pd.DataFrame:
+    """
+    Effect on the mean block reliability of shifting each random parameter.
+
+    Each sampled parameter of each component is scaled by
+    1 +/- variation_percent / 100 in turn, on the same baseline samples.
+
+    Args:
+        df: DataFrame containing component data
+        sheet_name: Name of the sheet/block to analyze
+        variation_percent: Perturbation of the sampled values (%)
+        n_iterations: Number of Monte Carlo iterations
+        t_mission: Mission time (hours)
+        rng: Random generator (defaults to the task 1 RNG)
+
+    Returns:
+        DataFrame with columns ['Reference', 'Parameter', 'R_minus', 'R_plus',
+        'Sensitivity'] where Sensitivity is the relative change of the mean
+        reliability per relative change of the parameter, for the pairs that
+        change a failure rate, sorted by decreasing absolute sensitivity
+    """
+    block_df = df[df['Sheet'] == sheet_name]
+    if block_df.empty:
+        raise ValueError(f"No components found for sheet '{sheet_name}'")
+
+    workspace = _MCWorkspace.sample(block_df, n_iterations, rng)
+    R_mean = workspace.mean_reliability(t_mission)
+    delta = variation_percent / 100
+
+    R = workspace.perturbed_reliabilities(np.array([1 - delta, 1 + delta]), t_mission)
+    sensitivity = (R[:, 1] - R[:, 0]) / (2 * delta * R_mean)
+
+    names = list(workspace.samples)
+    n_components = len(block_df)
+    result = pd.DataFrame({
+        'Reference': np.tile(block_df['Reference'].to_numpy(), len(names)),
+        'Parameter': np.repeat(names, n_components),
+        'R_minus': R[:, 0].ravel(),
+        'R_plus': R[:, 1].ravel(),
+        'Sensitivity': sensitivity.ravel(),
+    })
+    result = result[result['Sensitivity'] != 0]
+    order = np.argsort(-result['Sensitivity'].abs().to_numpy(), kind='stable')
+    return result.iloc[order].reset_index(drop=True)
+
+
+def print_mc_parameter_sensitivities(sensitivities: pd.DataFrame, variation_percent: float, top: int = 10):
+    """Print the random parameters with the largest effect on the mean reliability"""
+    print(f"\n{Colors.CYAN}Monte Carlo sensitivities (+/-{variation_percent:g}% on sampled values):{Colors.ENDC}")
+    print(f"{Colors.BOLD}{'Reference':<15} {'Parameter':<22} {'R (-)':>10} {'R (+)':>10} {'Sensitivity':>12}{Colors.ENDC}")
+    for ref, name, R_minus, R_plus, sensitivity in sensitivities.head(top).itertuples(index=False, name=None):
+        print(f"{ref:<15} {name:<22} {R_minus:>10.6f} {R_plus:>10.6f} {sensitivity:>12.3e}")
+
+
+# ============================================================================
+# DESIGN MARGINS
+# ============================================================================
+
+# Multipliers applied to the nominal parameter values
+MARGIN_GRID = np.linspace(0.1, 3.0, 256)
+
+# Reliability loss (from the nominal block value) allowed by the margins
+MARGIN_R_DROP = 1e-3
+
+def design_margins(df: pd.DataFrame, sheet_name: str, R_target: float,
+                   parameters: Tuple[str, ...] = SENSITIVITY_PARAMETERS,
+                   grid: np.ndarray = MARGIN_GRID,
+                   t_mission: float = rm.T_MISSION) -> pd.DataFrame:
+    """
+    How far each component parameter can move before R drops below R_target.
+
+    Every grid multiplier of every parameter is evaluated in one batched
+    call (all components are scaled together, which is valid because each
+    failure rate only depends on its own component). The block lambda with
+    only component k changed is then lambda_nominal - lambda_k + lambda_k(m).
+
+    Args:
+        df: DataFrame containing component data
+        sheet_name: Name of the sheet/block to analyze
+        R_target: Minimum acceptable block reliability
+        parameters: Parameter names ('LamB' or numeric columns)
+        grid: Multipliers of the nominal values to try
+        t_mission: Mission time (hours)
+
+    Returns:
+        DataFrame with columns ['Reference', 'Parameter', 'Value', 'Lower',
+        'Upper']: the smallest and largest grid multipliers reachable from 1
+        while keeping R >= R_target (1.0 when the first step already fails),
+        for every parameter that changes a failure rate
+    """
+    block_df = df[df['Sheet'] == sheet_name]
+    if block_df.empty:
+        raise ValueError(f"No components found for sheet '{sheet_name}'")
+
+    nominal = rm.nominal_parameters(block_df, parameters)
+    n_params, n_components = len(parameters), len(block_df)
+    grid = np.asarray(grid, dtype=np.float64)
+
+    # Rows (j, i): parameter j of every component scaled by grid[i]
+    overrides = {}
+    for j, name in enumerate(parameters):
+        values = np.tile(nominal[name], (n_params, len(grid), 1))
+        values[j] *= grid[:, None]
+        overrides[name] = values.reshape(-1, n_components)
+    lambdas = rm.sample_block_lambdas(block_df, overrides).reshape(n_params, len(grid), n_components)
+
+    base = rm.sample_block_lambdas(block_df, {name: nominal[name][None, :] for name in parameters})[0]
+    R = np.exp(-(base.sum() - base + lambdas) * t_mission)  # (n_params, n_grid, n_components)
+    ok = R >= R_target
+
+    def reach(side, multipliers):
+        # Multiplier of the last grid point before the first failure, walking away from 1
+        steps = np.logical_and.accumulate(ok[:, side], axis=1).sum(axis=1)
+        return np.where(steps > 0, multipliers[np.maximum(steps - 1, 0)], 1.0)
+
+    down, up = np.flatnonzero(grid < 1)[::-1], np.flatnonzero(grid > 1)
+    lower = reach(down, grid[down]) if len(down) else np.ones((n_params, n_components))
+    upper = reach(up, grid[up]) if len(up) else np.ones((n_params, n_components))
+
+    values = np.stack([nominal[name] for name in parameters])
+    changes = (lambdas != base).any(axis=1)
+    result = pd.DataFrame({
+        'Reference': np.tile(block_df['Reference'].to_numpy(), n_params),
+        'Parameter': np.repeat(parameters, n_components),
+        'Value': values.ravel(),
+        'Lower': lower.ravel(),
+        'Upper': upper.ravel(),
+    })
+    return result[np.isfinite(result['Value']) & changes.ravel()].reset_index(drop=True)
+
+
+def print_design_margins(margins: pd.DataFrame, R_target: float, grid: np.ndarray = MARGIN_GRID):
+    """Print the parameters whose margin ends inside the grid"""
+    limited = margins[(margins['Lower'] > grid.min()) | (margins['Upper'] < grid.max())]
+    print(f"\n{Colors.CYAN}Design margins for R >= {R_target:.6f} "
+          f"(multipliers of the nominal value, grid {grid.min():g} to {grid.max():g}):{Colors.ENDC}")
+    if limited.empty:
+        print("No single parameter change within the grid brings R below the target.")
+        return
+    print(f"{Colors.BOLD}{'Reference':<15} {'Parameter':<22} {'Value':>12} {'Lower':>8} {'Upper':>8}{Colors.ENDC}")
+    limited = limited.sort_values('Upper', kind='stable')
+    for ref, name, value, lower, upper in limited[['Reference', 'Parameter', 'Value', 'Lower', 'Upper']] \
+            .itertuples(index=False, name=None):
+        print(f"{ref:<15} {name:<22} {value:>12.4g} {lower:>8.3f} {upper:>8.3f}")
+
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
@@ -51,15 +499,37 @@ def run_sensitivity_analysis(excel_file: str,
     """
     # Load Excel file
     print_info(f"Loading data from {excel_file}...")
-    df = pd.read_excel(excel_file)
+    df = rm.load_components(excel_file)
 
     if 'Sheet' not in df.columns:
         raise ValueError("Excel file must have a 'Sheet' column")
 
-    # TODO: Implement the complete analysis workflow
+    # Variance-based indices of the block reliability
+    print_info(f"Estimating Sobol indices for {sheet_name}...")
+    indices = sobol_indices(df, sheet_name)
+    print_sobol_indices(indices)
+
+    # Local effect of each nominal parameter
+    print_info("Computing parameter sensitivities...")
+    sensitivities = parameter_sensitivities(df, sheet_name)
+    print_parameter_sensitivities(sensitivities)
+
+    # Mean reliability response to shifts of the random parameters
+    print_info(f"Perturbing random parameters by +/-{variation_percent:g}%...")
+    print_mc_parameter_sensitivities(
+        mc_parameter_sensitivities(df, sheet_name, variation_percent), variation_percent
+    )
+
+    # Room left on each parameter before losing MARGIN_R_DROP of reliability
+    _, _, R_nominal = rm.calculate_block_reliability(df, sheet_name, verbose=False, return_df=False)
+    R_target = R_nominal - MARGIN_R_DROP
+    print_design_margins(design_margins(df, sheet_name, R_target), R_target)
+
+    # Plots: this block's parameters, then the block and its sub-blocks side by side
+    plot_tornado_diagram(sensitivities, sheet_name)
+    sheets = [sheet for sheet in df['Sheet'].cat.categories if str(sheet).startswith(sheet_name)]
+    plot_sensitivity_heatmap(df, sheets)
 
-    # c.f. run_block_reliability() in main.py if you want inspiration for the
-    # automation
     print("\nAnalysis complete")
 
 